@@ -48,6 +48,10 @@ export interface ResearchSettings {
   enable_image_generation?: boolean;  // Generate header images using DALL-E
   research_mode?: 'standard' | 'firecrawl';  // Research mode - standard uses Brave/Perplexity, firecrawl uses Firecrawl for deep extraction
   rate_limit_firecrawl_agent?: boolean;  // Limit firecrawl_agent to 5 calls/day (free tier)
+  topics_per_request?: number;  // Topics researched together in one Claude conversation (default: 1)
+  use_batch_api?: boolean;  // CLI runs synthesize via the Message Batches API (cheaper, not realtime)
+  api_requests_per_minute?: number;  // Client-side cap on Claude API requests (default: 50, 0 = no limit)
+  api_tokens_per_minute?: number;  // Client-side cap on Claude API tokens (default: 0 = no limit)
 }
 
 export interface UserFeedback {
@@ -7,6 +7,8 @@ use clap::{Parser, Subcommand};
 use colored::Colorize;
 use comfy_table::{presets::UTF8_FULL, ContentArrangement, Table};
 use scopeguard::defer;
+use std::fmt::Write as _;
+use std::sync::atomic::{AtomicBool, Ordering};
 use uuid::Uuid;
 
 use claudius::{
@@ -18,10 +20,18 @@ use claudius::{
 
 const VERSION: &str = env!("CARGO_PKG_VERSION");
 
+/// Set from the global `--pretty` flag before any command runs.
+static PRETTY_JSON: AtomicBool = AtomicBool::new(false);
+
 /// Helper to safely serialize JSON for output. Returns error JSON if serialization fails.
+/// Output is compact unless `--pretty` was given, since it is usually read by scripts.
 fn to_json<T: serde::Serialize>(value: &T) -> String {
-    serde_json::to_string_pretty(value)
-        .unwrap_or_else(|e| format!("{{\"error\": \"JSON serialization failed: {}\"}}", e))
+    let result = if PRETTY_JSON.load(Ordering::Relaxed) {
+        serde_json::to_string_pretty(value)
+    } else {
+        serde_json::to_string(value)
+    };
+    result.unwrap_or_else(|e| format!("{{\"error\": \"JSON serialization failed: {}\"}}", e))
 }
 
 #[derive(Parser)]
@@ -36,6 +46,10 @@ struct Cli {
     #[arg(long, global = true)]
     json: bool,
 
+    /// Pretty-print JSON output (with --json)
+    #[arg(long, global = true)]
+    pretty: bool,
+
     #[command(subcommand)]
     command: Commands,
 }
@@ -158,6 +172,9 @@ enum ResearchAction {
         /// Show verbose output
         #[arg(short, long)]
         verbose: bool,
+        /// Ignore cached research from recent runs
+        #[arg(long)]
+        fresh: bool,
     },
     /// Show research status
     Status,
@@ -277,6 +294,7 @@ enum HousekeepingAction {
 #[tokio::main]
 async fn main() {
     let cli = Cli::parse();
+    PRETTY_JSON.store(cli.pretty, Ordering::Relaxed);
 
     // Initialize tracing for verbose output
     tracing_subscriber::fmt().with_target(false).init();
@@ -435,6 +453,137 @@ fn find_topic(conn: &rusqlite::Connection, id_or_name: &str) -> Result<Topic, St
 // Briefings Handlers
 // ============================================================================
 
+/// Borrowed view of a briefing for JSON output.
+/// Serialized directly so the cards are not copied into an intermediate
+/// `serde_json::Value` tree first.
+#[derive(serde::Serialize)]
+struct BriefingJson<'a> {
+    id: i64,
+    date: &'a str,
+    title: &'a str,
+    cards: &'a [BriefingCard],
+}
+
+impl<'a> BriefingJson<'a> {
+    fn new(briefing: &'a Briefing, cards: &'a [BriefingCard]) -> Self {
+        Self {
+            id: briefing.id,
+            date: &briefing.date,
+            title: &briefing.title,
+            cards,
+        }
+    }
+}
+
+/// Briefing JSON output including research metadata (`briefings show`).
+#[derive(serde::Serialize)]
+struct BriefingDetailJson<'a> {
+    #[serde(flatten)]
+    briefing: BriefingJson<'a>,
+    model_used: Option<&'a str>,
+    research_time_ms: Option<i64>,
+    total_tokens: Option<i64>,
+}
+
+/// One row of `briefings list` JSON output.
+#[derive(serde::Serialize)]
+struct BriefingSummaryJson<'a> {
+    id: i64,
+    date: &'a str,
+    title: &'a str,
+    card_count: usize,
+    model_used: Option<&'a str>,
+    research_time_ms: Option<i64>,
+}
+
+impl<'a> From<&'a Briefing> for BriefingSummaryJson<'a> {
+    fn from(briefing: &'a Briefing) -> Self {
+        Self {
+            id: briefing.id,
+            date: &briefing.date,
+            title: &briefing.title,
+            card_count: db::count_briefing_cards(&briefing.cards),
+            model_used: briefing.model_used.as_deref(),
+            research_time_ms: briefing.research_time_ms,
+        }
+    }
+}
+
+/// Briefing list JSON output (`briefings list`).
+#[derive(serde::Serialize)]
+struct BriefingListJson<'a> {
+    briefings: Vec<BriefingSummaryJson<'a>>,
+}
+
+/// Search results JSON output (`briefings search`).
+#[derive(serde::Serialize)]
+struct SearchResultsJson<'a> {
+    query: &'a str,
+    results: &'a [Briefing],
+}
+
+/// Rule printed after each card in `briefings show` (60 box-drawing dashes).
+const CARD_SEPARATOR: &str = "────────────────────────────────────────────────────────────";
+
+/// Render a briefing for terminal display (`briefings show`).
+///
+/// Everything is written into one pre-sized buffer so the caller can print it
+/// with a single write instead of a `println!` per line.
+fn format_briefing_for_display(briefing: &Briefing, cards: &[BriefingCard]) -> String {
+    let estimated_len: usize = cards
+        .iter()
+        .map(|c| c.title.len() + c.summary.len() + c.detailed_content.len() + 512)
+        .sum();
+    let mut out = String::with_capacity(estimated_len + 256);
+    // Writing into a String cannot fail.
+    let _ = write_briefing(&mut out, briefing, cards);
+    out
+}
+
+fn write_briefing(
+    out: &mut String,
+    briefing: &Briefing,
+    cards: &[BriefingCard],
+) -> std::fmt::Result {
+    writeln!(out, "{}", briefing.title.bold())?;
+    writeln!(out, "{}", briefing.date.dimmed())?;
+    writeln!(out)?;
+
+    for (i, card) in cards.iter().enumerate() {
+        write_card(out, i + 1, card)?;
+        writeln!(out, "{}", CARD_SEPARATOR.dimmed())?;
+        writeln!(out)?;
+    }
+
+    if let Some(ms) = briefing.research_time_ms {
+        writeln!(out, "Research completed in {}s", ms / 1000)?;
+    }
+    Ok(())
+}
+
+fn write_card(out: &mut String, number: usize, card: &BriefingCard) -> std::fmt::Result {
+    writeln!(out, "{}. {}", number, card.title.cyan().bold())?;
+    if !card.topic.is_empty() {
+        writeln!(out, "   Topic: {}", card.topic.dimmed())?;
+    }
+    writeln!(out)?;
+    writeln!(out, "   {}", card.summary)?;
+    writeln!(out)?;
+    if !card.detailed_content.is_empty() {
+        writeln!(out, "   {}", "Details:".yellow())?;
+        writeln!(out, "   {}", card.detailed_content)?;
+        writeln!(out)?;
+    }
+    if !card.sources.is_empty() {
+        writeln!(out, "   {}", "Sources:".dimmed())?;
+        for source in &card.sources {
+            writeln!(out, "   - {}", source)?;
+        }
+        writeln!(out)?;
+    }
+    Ok(())
+}
+
 async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), String> {
     let conn = db::get_connection().map_err(|e| format!("Database connection failed: {}", e))?;
 
@@ -443,26 +592,11 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
             let briefings = get_briefings(&conn, limit)?;
 
             if json {
-                let output: Vec<serde_json::Value> = briefings
-                    .iter()
-                    .map(|b| {
-                        let cards: Vec<BriefingCard> =
-                            serde_json::from_str(&b.cards).unwrap_or_default();
-                        serde_json::json!({
-                            "id": b.id,
-                            "date": b.date,
-                            "title": b.title,
-                            "card_count": cards.len(),
-                            "model_used": b.model_used,
-                            "research_time_ms": b.research_time_ms,
-                        })
-                    })
-                    .collect();
                 println!(
                     "{}",
-                    to_json(&serde_json::json!({
-                        "briefings": output
-                    }))
+                    to_json(&BriefingListJson {
+                        briefings: briefings.iter().map(BriefingSummaryJson::from).collect(),
+                    })
                 );
             } else if briefings.is_empty() {
                 println!("{}", "No briefings found.".yellow());
@@ -474,8 +608,6 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
                 table.set_header(vec!["ID", "Date", "Title", "Cards", "Duration"]);
 
                 for b in &briefings {
-                    let cards: Vec<BriefingCard> =
-                        serde_json::from_str(&b.cards).unwrap_or_default();
                     let duration = b
                         .research_time_ms
                         .map(|ms| format!("{}s", ms / 1000))
@@ -484,7 +616,7 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
                         &b.id.to_string(),
                         &b.date[..10], // Just date part
                         &b.title,
-                        &cards.len().to_string(),
+                        &db::count_briefing_cards(&b.cards).to_string(),
                         &duration,
                     ]);
                 }
@@ -501,48 +633,15 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
             if json {
                 println!(
                     "{}",
-                    to_json(&serde_json::json!({
-                        "id": briefing.id,
-                        "date": briefing.date,
-                        "title": briefing.title,
-                        "cards": cards,
-                        "model_used": briefing.model_used,
-                        "research_time_ms": briefing.research_time_ms,
-                        "total_tokens": briefing.total_tokens,
-                    }))
+                    to_json(&BriefingDetailJson {
+                        briefing: BriefingJson::new(&briefing, &cards),
+                        model_used: briefing.model_used.as_deref(),
+                        research_time_ms: briefing.research_time_ms,
+                        total_tokens: briefing.total_tokens,
+                    })
                 );
             } else {
-                println!("{}", briefing.title.bold());
-                println!("{}", briefing.date.dimmed());
-                println!();
-
-                for (i, card) in cards.iter().enumerate() {
-                    println!("{}. {}", i + 1, card.title.cyan().bold());
-                    if !card.topic.is_empty() {
-                        println!("   Topic: {}", card.topic.dimmed());
-                    }
-                    println!();
-                    println!("   {}", card.summary);
-                    println!();
-                    if !card.detailed_content.is_empty() {
-                        println!("   {}", "Details:".yellow());
-                        println!("   {}", card.detailed_content);
-                        println!();
-                    }
-                    if !card.sources.is_empty() {
-                        println!("   {}", "Sources:".dimmed());
-                        for source in &card.sources {
-                            println!("   - {}", source);
-                        }
-                        println!();
-                    }
-                    println!("{}", "─".repeat(60).dimmed());
-                    println!();
-                }
-
-                if let Some(ms) = briefing.research_time_ms {
-                    println!("Research completed in {}s", ms / 1000);
-                }
+                print!("{}", format_briefing_for_display(&briefing, &cards));
             }
         }
 
@@ -552,10 +651,10 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
             if json {
                 println!(
                     "{}",
-                    to_json(&serde_json::json!({
-                        "query": query,
-                        "results": briefings,
-                    }))
+                    to_json(&SearchResultsJson {
+                        query: &query,
+                        results: &briefings,
+                    })
                 );
             } else if briefings.is_empty() {
                 println!(
@@ -586,15 +685,7 @@ async fn handle_briefings(action: BriefingAction, json: bool) -> Result<(), Stri
 
             match format.as_str() {
                 "json" => {
-                    println!(
-                        "{}",
-                        to_json(&serde_json::json!({
-                            "id": briefing.id,
-                            "date": briefing.date,
-                            "title": briefing.title,
-                            "cards": cards,
-                        }))
-                    );
+                    println!("{}", to_json(&BriefingJson::new(&briefing, &cards)));
                 }
                 "markdown" | "md" => {
                     println!("# {}", briefing.title);
@@ -721,9 +812,24 @@ fn search_briefings(conn: &rusqlite::Connection, query: &str) -> Result<Vec<Brie
 // Research Handlers
 // ============================================================================
 
+/// `research now` JSON output.
+#[derive(serde::Serialize)]
+struct ResearchCompletedJson<'a> {
+    status: &'static str,
+    title: &'a str,
+    cards: usize,
+    duration_ms: u128,
+    model: &'a str,
+    tokens: u32,
+}
+
 async fn handle_research(action: ResearchAction, json: bool) -> Result<(), String> {
     match action {
-        ResearchAction::Now { topic, verbose } => {
+        ResearchAction::Now {
+            topic,
+            verbose,
+            fresh,
+        } => {
             // Check for API key
             let api_key = require_api_key()?;
 
@@ -818,6 +924,14 @@ async fn handle_research(action: ResearchAction, json: bool) -> Result<(), Strin
                 settings.research_mode.clone(),
                 settings.rate_limit_firecrawl_agent,
             );
+            agent.set_topics_per_request(settings.topics_per_request);
+            agent.set_rate_limits(
+                settings.api_requests_per_minute,
+                settings.api_tokens_per_minute,
+            );
+            // Unattended runs can wait on a batch; the app stays realtime
+            agent.set_use_batch_api(settings.use_batch_api);
+            agent.set_force_refresh(fresh);
 
             let start = std::time::Instant::now();
             let condense = settings.condense_briefings;
@@ -982,14 +1096,14 @@ async fn handle_research(action: ResearchAction, json: bool) -> Result<(), Strin
             if json {
                 println!(
                     "{}",
-                    to_json(&serde_json::json!({
-                        "status": "completed",
-                        "title": result.title,
-                        "cards": result.cards.len(),
-                        "duration_ms": duration.as_millis(),
-                        "model": result.model_used,
-                        "tokens": result.total_tokens,
-                    }))
+                    to_json(&ResearchCompletedJson {
+                        status: "completed",
+                        title: &result.title,
+                        cards: result.cards.len(),
+                        duration_ms: duration.as_millis(),
+                        model: &result.model_used,
+                        tokens: result.total_tokens,
+                    })
                 );
             } else {
                 println!("{} Research completed!", "✓".green().bold());
@@ -1099,17 +1213,23 @@ async fn handle_research(action: ResearchAction, json: bool) -> Result<(), Strin
     Ok(())
 }
 
+/// API key for CLI research runs. An `ANTHROPIC_API_KEY` environment variable
+/// (common under cron/CI) is used as-is, skipping the `.env` file read.
 fn require_api_key() -> Result<String, String> {
-    read_api_key().ok_or_else(|| {
-        format!(
-            "{}\n\n{}\n  {}\n\n{}\n  {}",
-            "Error: No API key configured.".red().bold(),
-            "Set your Anthropic API key with:",
-            "claudius config api-key set <YOUR_KEY>".cyan(),
-            "Or create ~/.claudius/.env with:",
-            "ANTHROPIC_API_KEY=sk-ant-...".dimmed()
-        )
-    })
+    std::env::var("ANTHROPIC_API_KEY")
+        .ok()
+        .filter(|key| !key.trim().is_empty())
+        .or_else(read_api_key)
+        .ok_or_else(|| {
+            format!(
+                "{}\n\n{}\n  {}\n\n{}\n  {}",
+                "Error: No API key configured.".red().bold(),
+                "Set your Anthropic API key with:",
+                "claudius config api-key set <YOUR_KEY>".cyan(),
+                "Or create ~/.claudius/.env with:",
+                "ANTHROPIC_API_KEY=sk-ant-...".dimmed()
+            )
+        })
 }
 
 // ============================================================================
@@ -1287,7 +1407,7 @@ async fn handle_mcp(action: McpAction, json: bool) -> Result<(), String> {
                     } else {
                         println!("{} Connection successful!", "✓".green());
                         println!("  Available tools: {}", tools.len());
-                        for tool in &tools {
+                        for tool in tools {
                             println!("    • {}", tool.tool.name);
                         }
                     }
@@ -12,7 +12,8 @@ use std::time::Duration;
 use tracing::{error, info};
 
 use crate::db::{self, ChatMessage};
-use crate::mcp_client::{load_mcp_servers, McpClient};
+use crate::mcp_client::{load_mcp_servers_async, tool_result_text, McpClient};
+use crate::research::{join_text, ResponseContentBlock};
 use serde_json::json;
 use tauri::Emitter;
 
@@ -51,13 +52,13 @@ struct Tool {
 
 /// Anthropic API message request with tool support.
 #[derive(Debug, Serialize)]
-struct ChatRequest {
-    model: String,
+struct ChatRequest<'a> {
+    model: &'a str,
     max_tokens: u32,
-    messages: Vec<Message>,
-    system: String,
+    messages: &'a [Message],
+    system: &'a str,
     #[serde(skip_serializing_if = "Option::is_none")]
-    tools: Option<Vec<serde_json::Value>>,
+    tools: Option<&'a [serde_json::Value]>,
 }
 
 /// A message in the conversation.
@@ -104,19 +105,10 @@ struct ChatResponse {
     stop_reason: Option<String>,
 }
 
-/// Content block in API response (for deserialization).
-#[derive(Debug, Deserialize)]
-struct ResponseContentBlock {
-    #[serde(rename = "type")]
-    content_type: String,
-    #[serde(default)]
-    text: Option<String>,
-    #[serde(default)]
-    id: Option<String>,
-    #[serde(default)]
-    name: Option<String>,
-    #[serde(default)]
-    input: Option<serde_json::Value>,
+impl ChatResponse {
+    fn text(&self) -> String {
+        join_text(&self.content)
+    }
 }
 
 #[derive(Debug, Deserialize)]
@@ -350,6 +342,9 @@ fn build_messages(history: &[ChatMessage], new_message: &str) -> Vec<Message> {
 /// Maximum number of tool iterations to prevent infinite loops.
 const MAX_TOOL_ITERATIONS: u32 = 5;
 
+/// Total timeout for each chat API request (long enough for tool-heavy turns).
+const CHAT_REQUEST_TIMEOUT: Duration = Duration::from_secs(120);
+
 /// Send a chat message and get a response from Claude.
 ///
 /// This function:
@@ -384,7 +379,7 @@ pub async fn send_chat_message(
     );
 
     // Initialize MCP client for tools
-    let mut mcp_client: Option<McpClient> = match load_mcp_servers() {
+    let mcp_client: Option<McpClient> = match load_mcp_servers_async().await {
         Ok(servers) => {
             let enabled_servers: Vec<_> = servers.into_iter().filter(|s| s.enabled).collect();
             if enabled_servers.is_empty() {
@@ -438,12 +433,8 @@ pub async fn send_chat_message(
     // Build messages array (will be mutated during agentic loop)
     let mut messages = build_messages(&history, user_message);
 
-    // Create HTTP client
-    let http_client = Client::builder()
-        .timeout(Duration::from_secs(120)) // Longer timeout for tool calls
-        .connect_timeout(Duration::from_secs(10))
-        .build()
-        .map_err(|e| format!("Failed to build HTTP client: {}", e))?;
+    // Shared HTTP client (pooled connections); requests set the chat timeout
+    let http_client = crate::http::client();
 
     info!(
         "Sending chat message for briefing {} card {} (tools: {}, web_search: {})",
@@ -468,15 +459,11 @@ pub async fn send_chat_message(
 
         // Create API request
         let request = ChatRequest {
-            model: model.to_string(),
+            model,
             max_tokens: 2048,
-            messages: messages.clone(),
-            system: system_prompt.clone(),
-            tools: if has_tools {
-                Some(tools_json.clone())
-            } else {
-                None
-            },
+            messages: &messages,
+            system: &system_prompt,
+            tools: if has_tools { Some(&tools_json) } else { None },
         };
 
         // Send request to Anthropic API
@@ -485,6 +472,7 @@ pub async fn send_chat_message(
             .header("x-api-key", api_key)
             .header("anthropic-version", "2023-06-01")
             .header("content-type", "application/json")
+            .timeout(CHAT_REQUEST_TIMEOUT)
             .json(&request)
             .send()
             .await
@@ -522,18 +510,7 @@ pub async fn send_chat_message(
         // If no tool calls or stop_reason is end_turn, we're done
         if tool_uses.is_empty() || chat_response.stop_reason.as_deref() == Some("end_turn") {
             // Extract final text response
-            final_text = chat_response
-                .content
-                .iter()
-                .filter_map(|block| {
-                    if block.content_type == "text" {
-                        block.text.clone()
-                    } else {
-                        None
-                    }
-                })
-                .collect::<Vec<_>>()
-                .join("\n");
+            final_text = chat_response.text();
 
             info!(
                 "Chat complete after {} iterations, {} total tokens",
@@ -567,7 +544,7 @@ pub async fn send_chat_message(
 
             let result = execute_chat_tool(
                 &http_client,
-                &mut mcp_client,
+                &mcp_client,
                 &builtin_tools,
                 tool_name,
                 &tool_input,
@@ -708,7 +685,7 @@ pub fn clear_chat_history(briefing_id: i64, card_index: i32) -> Result<usize, St
 /// Routes to built-in tools or MCP client based on tool name.
 async fn execute_chat_tool(
     http_client: &Client,
-    mcp_client: &mut Option<McpClient>,
+    mcp_client: &Option<McpClient>,
     builtin_tools: &HashSet<String>,
     tool_name: &str,
     tool_input: &serde_json::Value,
@@ -719,25 +696,17 @@ async fn execute_chat_tool(
     }
 
     // Try MCP client
-    if let Some(ref mut client) = mcp_client {
+    if let Some(client) = mcp_client {
         // Check if the tool exists in MCP
         let has_tool = client
             .get_all_tools()
-            .into_iter()
+            .iter()
             .any(|t| t.tool.name == tool_name);
 
         if has_tool {
             info!("Calling MCP tool '{}'", tool_name);
-            // call_tool returns serde_json::Value, convert to String
             let result = client.call_tool(tool_name, tool_input.clone())?;
-            // Convert Value to readable string
-            if let Some(s) = result.as_str() {
-                return Ok(s.to_string());
-            } else {
-                return Ok(
-                    serde_json::to_string_pretty(&result).unwrap_or_else(|_| result.to_string())
-                );
-            }
+            return Ok(tool_result_text(result));
         }
     }
 
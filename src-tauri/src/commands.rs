@@ -58,12 +58,28 @@ pub struct ResearchSettings {
     pub research_mode: String, // "standard" | "firecrawl" - determines which tools are used
     #[serde(default = "default_rate_limit_firecrawl_agent")]
     pub rate_limit_firecrawl_agent: bool, // Limit firecrawl_agent to 5 calls/day (free tier)
+    #[serde(default = "default_topics_per_request")]
+    pub topics_per_request: usize, // Topics researched together in one Claude conversation
+    #[serde(default)]
+    pub use_batch_api: bool, // Synthesize via the Message Batches API on CLI runs (cheaper, slower)
+    #[serde(default = "default_api_requests_per_minute")]
+    pub api_requests_per_minute: u32, // Client-side cap on Claude API requests (0 = no limit)
+    #[serde(default)]
+    pub api_tokens_per_minute: u32, // Client-side cap on Claude API tokens (0 = no limit)
 }
 
 fn default_rate_limit_firecrawl_agent() -> bool {
     true
 }
 
+fn default_topics_per_request() -> usize {
+    1
+}
+
+fn default_api_requests_per_minute() -> u32 {
+    50 // Anthropic's lowest usage tier
+}
+
 fn default_notification_sound() -> bool {
     true
 }
@@ -134,10 +150,7 @@ fn read_mcp_servers() -> Result<MCPServersConfig, String> {
         tracing::debug!("MCP servers file doesn't exist, returning empty config");
         return Ok(MCPServersConfig { servers: vec![] });
     }
-    let content =
-        std::fs::read_to_string(&path).map_err(|e| format!("Failed to read MCP servers: {}", e))?;
-    tracing::debug!("MCP servers file content: {}", content);
-    serde_json::from_str(&content).map_err(|e| format!("Failed to parse MCP servers: {}", e))
+    crate::config::read_json_cached(&path, "MCP servers")
 }
 
 fn write_mcp_servers(config: &MCPServersConfig) -> Result<(), String> {
@@ -145,7 +158,9 @@ fn write_mcp_servers(config: &MCPServersConfig) -> Result<(), String> {
     let path = get_mcp_servers_path();
     let content = serde_json::to_string_pretty(&config)
         .map_err(|e| format!("Failed to serialize MCP servers: {}", e))?;
-    std::fs::write(&path, content).map_err(|e| format!("Failed to write MCP servers: {}", e))
+    std::fs::write(&path, content).map_err(|e| format!("Failed to write MCP servers: {}", e))?;
+    crate::config::invalidate_json_cache(&path);
+    Ok(())
 }
 
 fn read_settings() -> Result<ResearchSettings, String> {
@@ -166,11 +181,13 @@ fn read_settings() -> Result<ResearchSettings, String> {
             enable_image_generation: true,
             research_mode: default_research_mode(),
             rate_limit_firecrawl_agent: default_rate_limit_firecrawl_agent(),
+            topics_per_request: default_topics_per_request(),
+            use_batch_api: false,
+            api_requests_per_minute: default_api_requests_per_minute(),
+            api_tokens_per_minute: 0,
         });
     }
-    let content =
-        std::fs::read_to_string(&path).map_err(|e| format!("Failed to read settings: {}", e))?;
-    serde_json::from_str(&content).map_err(|e| format!("Failed to parse settings: {}", e))
+    crate::config::read_json_cached(&path, "settings")
 }
 
 fn write_settings(settings: &ResearchSettings) -> Result<(), String> {
@@ -178,7 +195,9 @@ fn write_settings(settings: &ResearchSettings) -> Result<(), String> {
     let path = get_preferences_path();
     let content = serde_json::to_string_pretty(&settings)
         .map_err(|e| format!("Failed to serialize settings: {}", e))?;
-    std::fs::write(&path, content).map_err(|e| format!("Failed to write settings: {}", e))
+    std::fs::write(&path, content).map_err(|e| format!("Failed to write settings: {}", e))?;
+    crate::config::invalidate_json_cache(&path);
+    Ok(())
 }
 
 // Legacy config helpers for backwards compatibility
@@ -437,6 +456,10 @@ pub async fn trigger_research(app: tauri::AppHandle) -> Result<String, String> {
         enable_image_generation: true,
         research_mode: default_research_mode(),
         rate_limit_firecrawl_agent: default_rate_limit_firecrawl_agent(),
+        topics_per_request: default_topics_per_request(),
+        use_batch_api: false,
+        api_requests_per_minute: default_api_requests_per_minute(),
+        api_tokens_per_minute: 0,
     });
 
     // Get API key from file-based storage
@@ -525,6 +548,14 @@ pub async fn trigger_research(app: tauri::AppHandle) -> Result<String, String> {
         settings.rate_limit_firecrawl_agent,
     );
     agent.set_cancellation_token(cancellation_token);
+    agent.set_topics_per_request(settings.topics_per_request);
+    agent.set_rate_limits(
+        settings.api_requests_per_minute,
+        settings.api_tokens_per_minute,
+    );
+    // Runs from the app are always user-requested: research afresh rather
+    // than replaying cached topics (dedup would drop them as repeats).
+    agent.set_force_refresh(true);
 
     let mut result = match agent
         .run_research(
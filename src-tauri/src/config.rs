@@ -6,8 +6,14 @@
 // Note: Many functions are used by CLI but not by Tauri app, so we allow dead_code.
 #![allow(dead_code)]
 
+use lazy_static::lazy_static;
+use serde::de::DeserializeOwned;
 use serde::{Deserialize, Serialize};
-use std::path::PathBuf;
+use std::any::{Any, TypeId};
+use std::collections::HashMap;
+use std::path::{Path, PathBuf};
+use std::sync::Mutex;
+use std::time::SystemTime;
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct MCPServer {
@@ -48,12 +54,28 @@ pub struct ResearchSettings {
     pub research_mode: String, // "standard" | "firecrawl" - determines which tools are used
     #[serde(default = "default_rate_limit_firecrawl_agent")]
     pub rate_limit_firecrawl_agent: bool, // Limit firecrawl_agent to 5 calls/day (free tier)
+    #[serde(default = "default_topics_per_request")]
+    pub topics_per_request: usize, // Topics researched together in one Claude conversation
+    #[serde(default)]
+    pub use_batch_api: bool, // Synthesize via the Message Batches API on CLI runs (cheaper, slower)
+    #[serde(default = "default_api_requests_per_minute")]
+    pub api_requests_per_minute: u32, // Client-side cap on Claude API requests (0 = no limit)
+    #[serde(default)]
+    pub api_tokens_per_minute: u32, // Client-side cap on Claude API tokens (0 = no limit)
 }
 
 fn default_rate_limit_firecrawl_agent() -> bool {
     true
 }
 
+fn default_topics_per_request() -> usize {
+    1
+}
+
+fn default_api_requests_per_minute() -> u32 {
+    50 // Anthropic's lowest usage tier
+}
+
 fn default_notification_sound() -> bool {
     true
 }
@@ -86,6 +108,10 @@ impl Default for ResearchSettings {
             enable_image_generation: true,
             research_mode: default_research_mode(),
             rate_limit_firecrawl_agent: default_rate_limit_firecrawl_agent(),
+            topics_per_request: default_topics_per_request(),
+            use_batch_api: false,
+            api_requests_per_minute: default_api_requests_per_minute(),
+            api_tokens_per_minute: 0,
         }
     }
 }
@@ -113,6 +139,74 @@ pub fn ensure_config_dir() -> Result<PathBuf, String> {
     Ok(config_dir)
 }
 
+// ============================================================================
+// Cached JSON Reads
+// ============================================================================
+
+/// A parsed config file, valid while the file's mtime and size are unchanged.
+struct CachedJson {
+    modified: SystemTime,
+    len: u64,
+    value: Box<dyn Any + Send>,
+}
+
+lazy_static! {
+    /// Parsed config files keyed by path and target type, since the same file
+    /// can be read into different structs by different modules.
+    static ref JSON_CACHE: Mutex<HashMap<(PathBuf, TypeId), CachedJson>> =
+        Mutex::new(HashMap::new());
+}
+
+/// Read and parse a JSON config file, reusing the previous parse while the
+/// file is unchanged on disk. `what` names the file in error messages.
+///
+/// Callers get their own clone, so mutating the result never touches the cache.
+pub fn read_json_cached<T>(path: &Path, what: &str) -> Result<T, String>
+where
+    T: DeserializeOwned + Clone + Send + 'static,
+{
+    let key = (path.to_path_buf(), TypeId::of::<T>());
+    let metadata =
+        std::fs::metadata(path).map_err(|e| format!("Failed to read {}: {}", what, e))?;
+    let modified = metadata.modified().ok();
+
+    if let (Some(modified), Ok(cache)) = (modified, JSON_CACHE.lock()) {
+        if let Some(entry) = cache.get(&key) {
+            if entry.modified == modified && entry.len == metadata.len() {
+                if let Some(value) = entry.value.downcast_ref::<T>() {
+                    return Ok(value.clone());
+                }
+            }
+        }
+    }
+
+    let content =
+        std::fs::read_to_string(path).map_err(|e| format!("Failed to read {}: {}", what, e))?;
+    let value: T =
+        serde_json::from_str(&content).map_err(|e| format!("Failed to parse {}: {}", what, e))?;
+
+    if let (Some(modified), Ok(mut cache)) = (modified, JSON_CACHE.lock()) {
+        cache.insert(
+            key,
+            CachedJson {
+                modified,
+                len: metadata.len(),
+                value: Box::new(value.clone()),
+            },
+        );
+    }
+
+    Ok(value)
+}
+
+/// Forget cached parses of `path`. Call after rewriting the file, since mtime
+/// granularity can be too coarse to notice a quick rewrite of the same size.
+pub fn invalidate_json_cache(path: &Path) {
+    if let Ok(mut cache) = JSON_CACHE.lock() {
+        cache.retain(|(cached_path, _), _| cached_path != path);
+    }
+}
+
 pub fn get_mcp_servers_path() -> PathBuf {
     get_config_dir().join("mcp-servers.json")
 }
@@ -170,9 +264,7 @@ pub fn read_mcp_servers() -> Result<MCPServersConfig, String> {
         write_mcp_servers(&config)?;
         return Ok(config);
     }
-    let content =
-        std::fs::read_to_string(&path).map_err(|e| format!("Failed to read MCP servers: {}", e))?;
-    serde_json::from_str(&content).map_err(|e| format!("Failed to parse MCP servers: {}", e))
+    read_json_cached(&path, "MCP servers")
 }
 
 pub fn write_mcp_servers(config: &MCPServersConfig) -> Result<(), String> {
@@ -180,7 +272,9 @@ pub fn write_mcp_servers(config: &MCPServersConfig) -> Result<(), String> {
     let path = get_mcp_servers_path();
     let content = serde_json::to_string_pretty(&config)
         .map_err(|e| format!("Failed to serialize MCP servers: {}", e))?;
-    std::fs::write(&path, content).map_err(|e| format!("Failed to write MCP servers: {}", e))
+    std::fs::write(&path, content).map_err(|e| format!("Failed to write MCP servers: {}", e))?;
+    invalidate_json_cache(&path);
+    Ok(())
 }
 
 // ============================================================================
@@ -192,9 +286,7 @@ pub fn read_settings() -> Result<ResearchSettings, String> {
     if !path.exists() {
         return Ok(ResearchSettings::default());
     }
-    let content =
-        std::fs::read_to_string(&path).map_err(|e| format!("Failed to read settings: {}", e))?;
-    serde_json::from_str(&content).map_err(|e| format!("Failed to parse settings: {}", e))
+    read_json_cached(&path, "settings")
 }
 
 pub fn write_settings(settings: &ResearchSettings) -> Result<(), String> {
@@ -202,7 +294,9 @@ pub fn write_settings(settings: &ResearchSettings) -> Result<(), String> {
     let path = get_preferences_path();
     let content = serde_json::to_string_pretty(&settings)
         .map_err(|e| format!("Failed to serialize settings: {}", e))?;
-    std::fs::write(&path, content).map_err(|e| format!("Failed to write settings: {}", e))
+    std::fs::write(&path, content).map_err(|e| format!("Failed to write settings: {}", e))?;
+    invalidate_json_cache(&path);
+    Ok(())
 }
 
 // ============================================================================
@@ -430,3 +524,28 @@ pub fn validate_openai_api_key(api_key: &str) -> Result<(), String> {
 
     Ok(())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_read_json_cached_sees_rewrites() {
+        let path =
+            std::env::temp_dir().join(format!("claudius-cache-{}.json", uuid::Uuid::new_v4()));
+
+        std::fs::write(&path, r#"{"servers": []}"#).unwrap();
+        let first: MCPServersConfig = read_json_cached(&path, "test config").unwrap();
+        let again: MCPServersConfig = read_json_cached(&path, "test config").unwrap();
+        assert!(first.servers.is_empty() && again.servers.is_empty());
+
+        let rewritten = r#"{"servers": [{"id": "1", "name": "A", "enabled": true, "config": {}}]}"#;
+        invalidate_json_cache(&path);
+        std::fs::write(&path, rewritten).unwrap();
+        let updated: MCPServersConfig = read_json_cached(&path, "test config").unwrap();
+        assert_eq!(updated.servers.len(), 1);
+
+        std::fs::remove_file(&path).unwrap();
+        assert!(read_json_cached::<MCPServersConfig>(&path, "test config").is_err());
+    }
+}
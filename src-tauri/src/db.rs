@@ -555,6 +555,16 @@ pub fn count_briefings(conn: &Connection) -> std::result::Result<usize, String>
     Ok(count as usize)
 }
 
+/// Count the cards in a briefing's stored `cards` JSON array.
+///
+/// Elements are skipped with `IgnoredAny`, so no card data is allocated.
+/// Returns 0 if the JSON is malformed.
+pub fn count_briefing_cards(cards_json: &str) -> usize {
+    serde_json::from_str::<Vec<serde::de::IgnoredAny>>(cards_json)
+        .map(|cards| cards.len())
+        .unwrap_or(0)
+}
+
 /// Count total cards across all briefings.
 pub fn count_cards(conn: &Connection) -> std::result::Result<usize, String> {
     let mut stmt = conn
@@ -570,10 +580,7 @@ pub fn count_cards(conn: &Connection) -> std::result::Result<usize, String> {
         .map_err(|e| format!("Failed to query briefings: {}", e))?;
 
     for cards_json in rows.flatten() {
-        // Parse JSON array and count elements
-        if let Ok(cards) = serde_json::from_str::<Vec<serde_json::Value>>(&cards_json) {
-            total_cards += cards.len();
-        }
+        total_cards += count_briefing_cards(&cards_json);
     }
 
     Ok(total_cards)
@@ -595,6 +602,17 @@ pub fn briefing_has_bookmarks(
     Ok(count > 0)
 }
 
+/// The subset of a stored card needed for deduplication; other fields are skipped.
+#[derive(Deserialize)]
+struct StoredCardFingerprint {
+    #[serde(default)]
+    title: String,
+    #[serde(default)]
+    topic: String,
+    #[serde(default)]
+    summary: String,
+}
+
 /// Get recent card fingerprints for deduplication.
 /// Returns (title, topic, summary) for all cards from the last N days.
 pub fn get_recent_card_fingerprints(
@@ -623,29 +641,13 @@ pub fn get_recent_card_fingerprints(
         let cards_json = row.map_err(|e| format!("Failed to read row: {}", e))?;
 
         // Parse JSON array of cards
-        if let Ok(cards) = serde_json::from_str::<Vec<serde_json::Value>>(&cards_json) {
+        if let Ok(cards) = serde_json::from_str::<Vec<StoredCardFingerprint>>(&cards_json) {
             for card in cards {
-                let title = card
-                    .get("title")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("")
-                    .to_string();
-                let topic = card
-                    .get("topic")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("")
-                    .to_string();
-                let summary = card
-                    .get("summary")
-                    .and_then(|v| v.as_str())
-                    .unwrap_or("")
-                    .to_string();
-
-                if !title.is_empty() {
+                if !card.title.is_empty() {
                     fingerprints.push(crate::dedup::CardFingerprint {
-                        title,
-                        topic,
-                        summary,
+                        title: card.title,
+                        topic: card.topic,
+                        summary: card.summary,
                     });
                 }
             }
@@ -655,6 +657,73 @@ pub fn get_recent_card_fingerprints(
     Ok(fingerprints)
 }
 
+// ============================================================================
+// Topic research cache
+// ============================================================================
+
+/// Create the cache table if needed. The CLI researches without running
+/// `init_database`, so the cache can't rely on the schema having been applied.
+fn ensure_topic_research_cache(conn: &Connection) -> std::result::Result<(), String> {
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS topic_research_cache (
+            cache_key TEXT PRIMARY KEY,
+            content TEXT NOT NULL,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )",
+        [],
+    )
+    .map_err(|e| format!("Failed to create topic research cache: {}", e))?;
+    Ok(())
+}
+
+/// Get a cached research result if it is younger than `max_age_secs`.
+pub fn get_cached_topic_research(
+    conn: &Connection,
+    cache_key: &str,
+    max_age_secs: i64,
+) -> std::result::Result<Option<String>, String> {
+    ensure_topic_research_cache(conn)?;
+
+    let result = conn.query_row(
+        "SELECT content FROM topic_research_cache
+         WHERE cache_key = ?1 AND created_at > datetime('now', ?2)",
+        params![cache_key, format!("-{} seconds", max_age_secs)],
+        |row| row.get(0),
+    );
+
+    match result {
+        Ok(content) => Ok(Some(content)),
+        Err(rusqlite::Error::QueryReturnedNoRows) => Ok(None),
+        Err(e) => Err(format!("Failed to read topic research cache: {}", e)),
+    }
+}
+
+/// Cache a research result, replacing any previous entry for the key.
+/// Entries older than `max_age_secs` are pruned at the same time.
+pub fn store_topic_research(
+    conn: &Connection,
+    cache_key: &str,
+    content: &str,
+    max_age_secs: i64,
+) -> std::result::Result<(), String> {
+    ensure_topic_research_cache(conn)?;
+
+    conn.execute(
+        "DELETE FROM topic_research_cache WHERE created_at <= datetime('now', ?1)",
+        [format!("-{} seconds", max_age_secs)],
+    )
+    .map_err(|e| format!("Failed to prune topic research cache: {}", e))?;
+
+    conn.execute(
+        "INSERT OR REPLACE INTO topic_research_cache (cache_key, content, created_at)
+         VALUES (?1, ?2, CURRENT_TIMESTAMP)",
+        params![cache_key, content],
+    )
+    .map_err(|e| format!("Failed to write topic research cache: {}", e))?;
+
+    Ok(())
+}
+
 // ============================================================================
 // Chat messages migration (add card_index column)
 // ============================================================================
@@ -817,6 +886,39 @@ mod tests {
         conn.last_insert_rowid()
     }
 
+    #[test]
+    fn test_topic_research_cache() {
+        let conn = setup_test_db();
+
+        assert_eq!(get_cached_topic_research(&conn, "k", 3600).unwrap(), None);
+
+        store_topic_research(&conn, "k", "first", 3600).unwrap();
+        store_topic_research(&conn, "k", "second", 3600).unwrap();
+        assert_eq!(
+            get_cached_topic_research(&conn, "k", 3600).unwrap(),
+            Some("second".to_string())
+        );
+
+        // Entries past the TTL are ignored
+        conn.execute(
+            "UPDATE topic_research_cache SET created_at = datetime('now', '-2 hours')",
+            [],
+        )
+        .unwrap();
+        assert_eq!(get_cached_topic_research(&conn, "k", 3600).unwrap(), None);
+    }
+
+    #[test]
+    fn test_topic_research_cache_without_schema() {
+        // The CLI never runs init_database; the cache creates its own table
+        let conn = Connection::open_in_memory().unwrap();
+        store_topic_research(&conn, "k", "content", 3600).unwrap();
+        assert_eq!(
+            get_cached_topic_research(&conn, "k", 3600).unwrap(),
+            Some("content".to_string())
+        );
+    }
+
     #[test]
     fn test_insert_chat_message() {
         let conn = setup_test_db();
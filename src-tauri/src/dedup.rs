@@ -30,18 +30,44 @@ impl CardFingerprint {
 
 /// Normalize text for comparison (lowercase, strip extra whitespace)
 fn normalize(s: &str) -> String {
-    s.to_lowercase()
-        .split_whitespace()
-        .collect::<Vec<_>>()
-        .join(" ")
+    let mut normalized = String::with_capacity(s.len());
+    for word in s.split_whitespace() {
+        if !normalized.is_empty() {
+            normalized.push(' ');
+        }
+        normalized.extend(word.chars().flat_map(char::to_lowercase));
+    }
+    normalized
 }
 
-/// Calculate similarity ratio between two strings (0.0 - 1.0)
-/// Uses normalized Levenshtein distance
-pub fn similarity(a: &str, b: &str) -> f64 {
-    let a = normalize(a);
-    let b = normalize(b);
+/// Card fields normalized once, so comparing one card against many past
+/// cards doesn't re-normalize the same strings on every comparison.
+struct NormalizedFingerprint {
+    title: String,
+    topic: String,
+    summary: String,
+}
 
+impl NormalizedFingerprint {
+    fn new(title: &str, topic: &str, summary: &str) -> Self {
+        Self {
+            title: normalize(title),
+            topic: normalize(topic),
+            summary: normalize(summary),
+        }
+    }
+
+    fn from_card(card: &BriefingCard) -> Self {
+        Self::new(&card.title, &card.topic, &card.summary)
+    }
+
+    fn from_fingerprint(fp: &CardFingerprint) -> Self {
+        Self::new(&fp.title, &fp.topic, &fp.summary)
+    }
+}
+
+/// Similarity between two already-normalized strings.
+fn normalized_similarity(a: &str, b: &str) -> f64 {
     if a.is_empty() && b.is_empty() {
         return 1.0;
     }
@@ -49,20 +75,43 @@ pub fn similarity(a: &str, b: &str) -> f64 {
         return 0.0;
     }
 
-    normalized_levenshtein(&a, &b)
+    normalized_levenshtein(a, b)
+}
+
+/// Calculate similarity ratio between two strings (0.0 - 1.0)
+/// Uses normalized Levenshtein distance
+pub fn similarity(a: &str, b: &str) -> f64 {
+    normalized_similarity(&normalize(a), &normalize(b))
 }
 
 /// Check if a card is a duplicate of any past card
 /// Only compares cards with the same topic
 pub fn is_duplicate(card: &BriefingCard, past: &[CardFingerprint], threshold: f64) -> bool {
-    for past_card in past {
+    let past_normalized: Vec<NormalizedFingerprint> = past
+        .iter()
+        .map(NormalizedFingerprint::from_fingerprint)
+        .collect();
+    is_duplicate_normalized(card, past, &past_normalized, threshold)
+}
+
+/// Duplicate check against past cards whose fields were normalized up front.
+/// `past` and `past_normalized` must be parallel slices.
+fn is_duplicate_normalized(
+    card: &BriefingCard,
+    past: &[CardFingerprint],
+    past_normalized: &[NormalizedFingerprint],
+    threshold: f64,
+) -> bool {
+    let normalized = NormalizedFingerprint::from_card(card);
+
+    for (past_card, past_norm) in past.iter().zip(past_normalized) {
         // Only compare cards from the same topic
-        if normalize(&card.topic) != normalize(&past_card.topic) {
+        if normalized.topic != past_norm.topic {
             continue;
         }
 
         // Check title similarity
-        let title_sim = similarity(&card.title, &past_card.title);
+        let title_sim = normalized_similarity(&normalized.title, &past_norm.title);
         if title_sim >= threshold {
             info!(
                 "Duplicate detected: '{}' similar to '{}' (similarity: {:.2})",
@@ -72,7 +121,7 @@ pub fn is_duplicate(card: &BriefingCard, past: &[CardFingerprint], threshold: f6
         }
 
         // Also check summary similarity for same-topic cards
-        let summary_sim = similarity(&card.summary, &past_card.summary);
+        let summary_sim = normalized_similarity(&normalized.summary, &past_norm.summary);
         if summary_sim >= threshold {
             info!(
                 "Duplicate detected via summary: '{}' (similarity: {:.2})",
@@ -96,10 +145,16 @@ pub fn filter_duplicates(
         return new_cards;
     }
 
+    // Normalize past cards once rather than once per new card
+    let past_normalized: Vec<NormalizedFingerprint> = past
+        .iter()
+        .map(NormalizedFingerprint::from_fingerprint)
+        .collect();
+
     let original_count = new_cards.len();
     let filtered: Vec<BriefingCard> = new_cards
         .into_iter()
-        .filter(|card| !is_duplicate(card, past, threshold))
+        .filter(|card| !is_duplicate_normalized(card, past, &past_normalized, threshold))
         .collect();
 
     let removed = original_count - filtered.len();
@@ -145,6 +200,12 @@ mod tests {
         assert!((similarity("Hello World", "hello world") - 1.0).abs() < 0.01);
     }
 
+    #[test]
+    fn test_normalize_collapses_whitespace_and_case() {
+        assert_eq!(normalize("  Hello\t  WORLD\n again "), "hello world again");
+        assert_eq!(normalize("   "), "");
+    }
+
     #[test]
     fn test_similarity_different_strings() {
         let sim = similarity("OpenAI releases GPT-5", "Anthropic announces Claude 4");
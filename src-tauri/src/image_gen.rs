@@ -152,7 +152,7 @@ pub async fn generate_image(
     debug!("  Prompt: {}", prompt);
     debug!("  Briefing: {}, Card: {}", briefing_id, card_index);
 
-    let client = reqwest::Client::new();
+    let client = crate::http::client();
 
     let request = DalleRequest {
         model: "dall-e-3".to_string(),
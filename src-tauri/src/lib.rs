@@ -9,8 +9,10 @@ pub mod config;
 pub mod db;
 pub mod dedup;
 pub mod housekeeping;
+pub mod http;
 pub mod image_gen;
 pub mod mcp_client;
+pub mod rate_limit;
 pub mod research;
 pub mod research_log;
 pub mod research_state;
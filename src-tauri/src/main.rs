@@ -5,9 +5,11 @@ mod config;
 mod db;
 mod dedup;
 mod housekeeping;
+mod http;
 mod image_gen;
 mod mcp_client;
 mod notifications;
+mod rate_limit;
 mod research;
 mod research_log;
 mod research_state;
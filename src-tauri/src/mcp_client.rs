@@ -4,18 +4,55 @@
 //! capabilities for the research agent. It spawns server processes and communicates
 //! via JSON-RPC 2.0 over stdio.
 
+use lazy_static::lazy_static;
 use serde::{Deserialize, Serialize};
 use serde_json::{json, Value};
 use std::collections::HashMap;
 use std::io::{BufRead, BufReader, Write};
-use std::process::{Child, Command, Stdio};
-use std::sync::atomic::{AtomicU64, Ordering};
+use std::process::{Child, ChildStderr, ChildStdout, Command, Stdio};
+use std::sync::atomic::{AtomicBool, AtomicU64, Ordering};
+use std::sync::{Mutex, TryLockError};
 use std::time::Duration;
 use tracing::{debug, info, warn};
 
 /// Counter for generating unique JSON-RPC request IDs.
 static REQUEST_ID: AtomicU64 = AtomicU64::new(1);
 
+/// How long a server has to start up and complete the MCP handshake.
+const CONNECT_TIMEOUT: Duration = Duration::from_secs(30);
+
+/// Read buffer for server stdout. Tool results (scraped pages, search results)
+/// are often hundreds of KB, so use far more than the 8 KiB default.
+const READ_BUFFER_SIZE: usize = 256 * 1024;
+
+lazy_static! {
+    /// PATH for spawned servers, including common Node.js locations.
+    /// macOS apps launched from Finder don't inherit shell PATH, so we need to
+    /// explicitly add locations where npx/node might be installed. Computed
+    /// once, since the process environment doesn't change between spawns.
+    static ref AUGMENTED_PATH: String = {
+        let mut path = std::env::var("PATH").unwrap_or_default();
+        let home = std::env::var("HOME").unwrap_or_default();
+        let extra_paths = [
+            "/opt/homebrew/bin".to_string(), // Homebrew on Apple Silicon
+            "/usr/local/bin".to_string(),    // Homebrew on Intel, or manual installs
+            "/opt/local/bin".to_string(),    // MacPorts
+            format!("{}/.nvm/versions/node/*/bin", home), // nvm
+            format!("{}/n/bin", home),       // n version manager
+            format!("{}/.local/bin", home),  // local bin
+        ];
+        for extra in &extra_paths {
+            if !path.contains(extra.as_str()) {
+                if !path.is_empty() {
+                    path.push(':');
+                }
+                path.push_str(extra);
+            }
+        }
+        path
+    };
+}
+
 /// MCP server configuration as stored in the config file.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct McpServerConfig {
@@ -41,6 +78,9 @@ pub struct McpConnection {
     pub server_name: String,
     pub server_id: String,
     child: Child,
+    /// Buffered server stdout, kept for the life of the connection so data
+    /// read ahead of one response is not lost before the next read.
+    reader: BufReader<ChildStdout>,
     tools: Vec<McpTool>,
     /// Original config for restarting the server if it crashes
     config: McpServerConfig,
@@ -63,20 +103,53 @@ impl Drop for McpConnection {
 }
 
 /// MCP Client that manages connections to multiple MCP servers.
+///
+/// Each connection has its own lock: calls to one server are serialized (one
+/// stdio stream), while calls to different servers run in parallel.
 pub struct McpClient {
-    connections: Vec<McpConnection>,
-    /// Maps tool names to server index for routing tool calls.
-    tool_routes: HashMap<String, usize>,
+    connections: Vec<Mutex<McpConnection>>,
+    /// Tools of every server, in connection order, as listed at connect time
+    tools: Vec<McpToolWithServer>,
+    /// Maps tool names (prefixed and unprefixed) to the server index and the
+    /// tool's name on that server, for routing tool calls.
+    tool_routes: HashMap<String, (usize, String)>,
+    /// Set by `shutdown`; no further calls are made (or servers restarted)
+    closed: AtomicBool,
+}
+
+impl Drop for McpClient {
+    fn drop(&mut self) {
+        // Kill every server before reaping any, so shutdown takes as long as
+        // the slowest server instead of the sum of all of them. Each
+        // McpConnection's own Drop then waits on its (already dying) child.
+        for conn in &mut self.connections {
+            let conn = conn.get_mut().unwrap_or_else(|e| e.into_inner());
+            let _ = conn.child.kill();
+        }
+    }
 }
 
 impl McpClient {
     /// Create a new MCP client by connecting to all enabled MCP servers.
     pub async fn connect(servers: Vec<McpServerConfig>) -> Result<Self, String> {
         let mut connections = Vec::new();
+        let mut tools = Vec::new();
         let mut tool_routes = HashMap::new();
 
-        for server in servers.into_iter().filter(|s| s.enabled) {
-            match Self::connect_to_server(&server).await {
+        // Start every server's handshake up front so their startup overlaps,
+        // then collect results in config order so routing stays deterministic.
+        let deadline = tokio::time::Instant::now() + CONNECT_TIMEOUT;
+        let pending: Vec<_> = servers
+            .into_iter()
+            .filter(|s| s.enabled)
+            .map(|server| {
+                let rx = Self::spawn_connect(&server);
+                (server, rx)
+            })
+            .collect();
+
+        for (server, rx) in pending {
+            match Self::wait_for_connect(&server.name, rx, deadline).await {
                 Ok(conn) => {
                     let server_idx = connections.len();
                     // Register all tools from this server
@@ -87,16 +160,21 @@ impl McpClient {
                             conn.server_name.replace(' ', "_").to_lowercase(),
                             tool.name
                         );
-                        tool_routes.insert(prefixed_name, server_idx);
+                        tool_routes.insert(prefixed_name, (server_idx, tool.name.clone()));
                         // Also register without prefix for direct calls
-                        tool_routes.insert(tool.name.clone(), server_idx);
+                        tool_routes.insert(tool.name.clone(), (server_idx, tool.name.clone()));
+                        tools.push(McpToolWithServer {
+                            server_name: conn.server_name.clone(),
+                            server_id: conn.server_id.clone(),
+                            tool: tool.clone(),
+                        });
                     }
                     info!(
                         "Connected to MCP server '{}' with {} tools",
                         conn.server_name,
                         conn.tools.len()
                     );
-                    connections.push(conn);
+                    connections.push(Mutex::new(conn));
                 }
                 Err(e) => {
                     warn!("Failed to connect to MCP server '{}': {}", server.name, e);
@@ -107,15 +185,25 @@ impl McpClient {
 
         Ok(Self {
             connections,
+            tools,
             tool_routes,
+            closed: AtomicBool::new(false),
         })
     }
 
     /// Connect to a single MCP server with timeout.
     /// Uses a separate thread with real timeout since the connection involves blocking I/O.
     async fn connect_to_server(server: &McpServerConfig) -> Result<McpConnection, String> {
+        let deadline = tokio::time::Instant::now() + CONNECT_TIMEOUT;
+        let rx = Self::spawn_connect(server);
+        Self::wait_for_connect(&server.name, rx, deadline).await
+    }
+
+    /// Start connecting to a server on its own thread, returning a channel for the result.
+    fn spawn_connect(
+        server: &McpServerConfig,
+    ) -> tokio::sync::oneshot::Receiver<Result<McpConnection, String>> {
         let server_clone = server.clone();
-        let server_name = server.name.clone();
 
         // Use oneshot channel to get result from thread
         let (tx, rx) = tokio::sync::oneshot::channel();
@@ -126,16 +214,25 @@ impl McpClient {
             let _ = tx.send(result);
         });
 
-        // Wait with timeout
-        match tokio::time::timeout(Duration::from_secs(30), rx).await {
+        rx
+    }
+
+    /// Wait for a connection started by `spawn_connect`, giving up at `deadline`.
+    async fn wait_for_connect(
+        server_name: &str,
+        rx: tokio::sync::oneshot::Receiver<Result<McpConnection, String>>,
+        deadline: tokio::time::Instant,
+    ) -> Result<McpConnection, String> {
+        match tokio::time::timeout_at(deadline, rx).await {
             Ok(Ok(result)) => result,
             Ok(Err(_)) => Err(format!(
                 "MCP server '{}' connection channel closed",
                 server_name
             )),
             Err(_) => Err(format!(
-                "MCP server '{}' connection timed out after 30 seconds",
-                server_name
+                "MCP server '{}' connection timed out after {} seconds",
+                server_name,
+                CONNECT_TIMEOUT.as_secs()
             )),
         }
     }
@@ -156,14 +253,14 @@ impl McpClient {
             .map(|arr| arr.iter().filter_map(|v| v.as_str()).collect())
             .unwrap_or_default();
 
-        // Get environment variables
-        let env: HashMap<String, String> = server
+        // Get environment variables (only the overrides; the rest is inherited)
+        let env: Vec<(&str, &str)> = server
             .config
             .get("env")
             .and_then(|v| v.as_object())
             .map(|obj| {
                 obj.iter()
-                    .filter_map(|(k, v)| v.as_str().map(|s| (k.clone(), s.to_string())))
+                    .filter_map(|(k, v)| v.as_str().map(|s| (k.as_str(), s)))
                     .collect()
             })
             .unwrap_or_default();
@@ -176,7 +273,7 @@ impl McpClient {
             info!(
                 "MCP server '{}' env vars: {:?}",
                 server.name,
-                env.keys().collect::<Vec<_>>()
+                env.iter().map(|(k, _)| k).collect::<Vec<_>>()
             );
         }
 
@@ -192,35 +289,17 @@ impl McpClient {
             cmd.env(key, value);
         }
 
-        // Ensure PATH includes common Node.js locations
-        // macOS apps launched from Finder don't inherit shell PATH, so we need to
-        // explicitly add locations where npx/node might be installed
-        let mut path = std::env::var("PATH").unwrap_or_default();
-        let extra_paths = [
-            "/opt/homebrew/bin", // Homebrew on Apple Silicon
-            "/usr/local/bin",    // Homebrew on Intel, or manual installs
-            "/opt/local/bin",    // MacPorts
-            &format!(
-                "{}/.nvm/versions/node/*/bin",
-                std::env::var("HOME").unwrap_or_default()
-            ), // nvm
-            &format!("{}/n/bin", std::env::var("HOME").unwrap_or_default()), // n version manager
-            &format!("{}/.local/bin", std::env::var("HOME").unwrap_or_default()), // local bin
-        ];
-        for extra in &extra_paths {
-            if !path.contains(extra) {
-                if !path.is_empty() {
-                    path.push(':');
-                }
-                path.push_str(extra);
-            }
-        }
-        cmd.env("PATH", &path);
+        cmd.env("PATH", AUGMENTED_PATH.as_str());
 
         let mut child = cmd
             .spawn()
             .map_err(|e| format!("Failed to spawn MCP server '{}': {}", server.name, e))?;
 
+        // Drain stderr so a chatty server can't fill the pipe and block
+        if let Some(stderr) = child.stderr.take() {
+            Self::spawn_stderr_drain(&server.name, stderr);
+        }
+
         // Initialize the connection
         let stdin = child
             .stdin
@@ -251,33 +330,32 @@ impl McpClient {
         Self::send_request(stdin, &init_request)?;
 
         // Read initialize response
-        let mut reader = BufReader::new(stdout);
+        let mut reader = BufReader::with_capacity(READ_BUFFER_SIZE, stdout);
         let _init_response = Self::read_response(&mut reader)?;
 
-        // Send initialized notification
+        // Send initialized notification and request tools list in one write.
+        // Initialize itself must be answered first, but everything after it can
+        // be pipelined.
         let initialized = json!({
             "jsonrpc": "2.0",
             "method": "notifications/initialized"
         });
-        let stdin = child.stdin.as_mut().unwrap();
-        Self::send_request(stdin, &initialized)?;
-
-        // Request tools list
         let tools_request = json!({
             "jsonrpc": "2.0",
             "id": REQUEST_ID.fetch_add(1, Ordering::SeqCst),
             "method": "tools/list",
             "params": {}
         });
-        Self::send_request(stdin, &tools_request)?;
+        let stdin = child.stdin.as_mut().unwrap();
+        Self::send_batch(stdin, &[&initialized, &tools_request])?;
 
-        let tools_response = Self::read_response(&mut reader)?;
+        let mut tools_response = Self::read_response(&mut reader)?;
 
         // Parse tools from response
         let tools: Vec<McpTool> = tools_response
-            .get("result")
-            .and_then(|r| r.get("tools"))
-            .and_then(|t| serde_json::from_value(t.clone()).ok())
+            .get_mut("result")
+            .and_then(|r| r.get_mut("tools"))
+            .and_then(|t| serde_json::from_value(t.take()).ok())
             .unwrap_or_default();
 
         debug!(
@@ -286,26 +364,64 @@ impl McpClient {
             tools.iter().map(|t| &t.name).collect::<Vec<_>>()
         );
 
-        // Reattach stdout for future reads
-        child.stdout = Some(reader.into_inner());
-
         Ok(McpConnection {
             server_name: server.name.clone(),
             server_id: server.id.clone(),
             child,
+            reader,
             tools,
             config: server.clone(),
         })
     }
 
+    /// Forward a server's stderr to the debug log on a background thread.
+    /// Nothing else reads stderr, and a server that fills the pipe buffer
+    /// blocks on its next write, stalling responses on stdout too. The
+    /// thread ends when the server exits and the pipe closes.
+    fn spawn_stderr_drain(server_name: &str, stderr: ChildStderr) {
+        let server_name = server_name.to_string();
+        std::thread::spawn(move || {
+            let mut reader = BufReader::new(stderr);
+            // Read raw bytes: a non-UTF-8 line must not stop the drain
+            let mut line = Vec::new();
+            loop {
+                line.clear();
+                match reader.read_until(b'\n', &mut line) {
+                    Ok(0) | Err(_) => break,
+                    Ok(_) => {
+                        let message = String::from_utf8_lossy(&line);
+                        let message = message.trim_end();
+                        if !message.is_empty() {
+                            debug!("MCP server '{}' stderr: {}", server_name, message);
+                        }
+                    }
+                }
+            }
+        });
+    }
+
     /// Send a JSON-RPC request to the server.
     fn send_request(stdin: &mut impl Write, request: &Value) -> Result<(), String> {
-        let request_str = serde_json::to_string(request)
-            .map_err(|e| format!("Failed to serialize request: {}", e))?;
+        Self::send_batch(stdin, &[request])
+    }
 
-        debug!("MCP request: {}", request_str);
+    /// Send one or more JSON-RPC messages with a single write and flush.
+    /// Messages are serialized straight into one byte buffer, newline-delimited.
+    fn send_batch(stdin: &mut impl Write, messages: &[&Value]) -> Result<(), String> {
+        let mut payload = Vec::with_capacity(256 * messages.len());
+        for message in messages {
+            let start = payload.len();
+            serde_json::to_writer(&mut payload, message)
+                .map_err(|e| format!("Failed to serialize request: {}", e))?;
+            debug!(
+                "MCP request: {}",
+                String::from_utf8_lossy(&payload[start..])
+            );
+            payload.push(b'\n');
+        }
 
-        writeln!(stdin, "{}", request_str)
+        stdin
+            .write_all(&payload)
             .map_err(|e| format!("Failed to write to MCP server: {}", e))?;
 
         stdin
@@ -318,21 +434,36 @@ impl McpClient {
     /// Read a JSON-RPC response from the server.
     /// This function skips over notifications (messages without an "id" field)
     /// and keeps reading until it gets an actual response.
-    fn read_response(reader: &mut BufReader<impl std::io::Read>) -> Result<Value, String> {
+    ///
+    /// Messages are normally one JSON object per line, but servers that use
+    /// LSP-style `Content-Length` framing are also accepted: the body is then
+    /// read in one `read_exact` instead of being scanned for a newline.
+    fn read_response(reader: &mut impl BufRead) -> Result<Value, String> {
+        let mut line = String::new();
         loop {
-            let mut line = String::new();
-            reader
+            line.clear();
+            let bytes_read = reader
                 .read_line(&mut line)
                 .map_err(|e| format!("Failed to read from MCP server: {}", e))?;
 
-            if line.trim().is_empty() {
-                continue;
+            if bytes_read == 0 {
+                return Err("MCP server closed its output stream".to_string());
             }
 
-            debug!("MCP message: {}", line.trim());
+            let message = line.trim();
+            if message.is_empty() {
+                continue;
+            }
 
-            let value: Value = serde_json::from_str(&line)
-                .map_err(|e| format!("Failed to parse MCP response: {}", e))?;
+            let value: Value = if let Some(length) = parse_content_length(message) {
+                let body = Self::read_framed_body(reader, length)?;
+                debug!("MCP message: {} bytes (Content-Length framed)", length);
+                serde_json::from_slice(&body)
+            } else {
+                debug!("MCP message: {}", message);
+                serde_json::from_str(message)
+            }
+            .map_err(|e| format!("Failed to parse MCP response: {}", e))?;
 
             // Skip notifications (they have a "method" field but no "id" field)
             // These are progress updates, logs, etc. that we don't need to process
@@ -351,21 +482,54 @@ impl McpClient {
         }
     }
 
+    /// Read the body of a `Content-Length` framed message whose length header
+    /// has already been consumed: skip any remaining headers up to the blank
+    /// separator line, then read exactly `length` bytes.
+    fn read_framed_body(reader: &mut impl BufRead, length: usize) -> Result<Vec<u8>, String> {
+        let mut header = String::new();
+        loop {
+            header.clear();
+            let bytes_read = reader
+                .read_line(&mut header)
+                .map_err(|e| format!("Failed to read from MCP server: {}", e))?;
+            if bytes_read == 0 {
+                return Err("MCP server closed its output stream".to_string());
+            }
+            if header.trim().is_empty() {
+                break;
+            }
+        }
+
+        let mut body = vec![0u8; length];
+        reader
+            .read_exact(&mut body)
+            .map_err(|e| format!("Failed to read from MCP server: {}", e))?;
+        Ok(body)
+    }
+
     /// Get all available tools from all connected servers.
-    pub fn get_all_tools(&self) -> Vec<McpToolWithServer> {
-        let mut tools = Vec::new();
+    pub fn get_all_tools(&self) -> &[McpToolWithServer] {
+        &self.tools
+    }
 
+    /// Stop the servers now, rather than when the client is dropped, and
+    /// refuse further tool calls. A server in the middle of a call is left
+    /// to finish it; it is stopped when the client is dropped.
+    pub fn shutdown(&self) {
+        self.closed.store(true, Ordering::SeqCst);
         for conn in &self.connections {
-            for tool in &conn.tools {
-                tools.push(McpToolWithServer {
-                    server_name: conn.server_name.clone(),
-                    server_id: conn.server_id.clone(),
-                    tool: tool.clone(),
-                });
+            match conn.try_lock() {
+                Ok(mut conn) => {
+                    let _ = conn.child.kill();
+                }
+                Err(TryLockError::Poisoned(e)) => {
+                    let _ = e.into_inner().child.kill();
+                }
+                Err(TryLockError::WouldBlock) => {
+                    debug!("MCP server busy at shutdown, stopping it on drop")
+                }
             }
         }
-
-        tools
     }
 
     /// Check if a tool is available.
@@ -374,44 +538,36 @@ impl McpClient {
         self.tool_routes.contains_key(tool_name)
     }
 
-    /// Call a tool on the appropriate MCP server.
-    pub fn call_tool(&mut self, tool_name: &str, arguments: Value) -> Result<Value, String> {
-        self.call_tool_with_retry(tool_name, arguments, true)
-    }
+    /// Call a tool on the appropriate MCP server. Blocks for the round-trip,
+    /// holding only that server's connection.
+    pub fn call_tool(&self, tool_name: &str, arguments: Value) -> Result<Value, String> {
+        if self.closed.load(Ordering::SeqCst) {
+            return Err("MCP client has been shut down".to_string());
+        }
 
-    /// Internal implementation of call_tool with optional retry on broken pipe.
-    fn call_tool_with_retry(
-        &mut self,
-        tool_name: &str,
-        arguments: Value,
-        allow_retry: bool,
-    ) -> Result<Value, String> {
-        // Find which server has this tool
-        let server_idx = *self
+        // Find which server has this tool, and its unprefixed name there
+        let (server_idx, actual_tool_name) = self
             .tool_routes
             .get(tool_name)
             .ok_or_else(|| format!("Unknown tool: {}", tool_name))?;
 
-        let conn = self
+        let mut conn = self
             .connections
-            .get_mut(server_idx)
-            .ok_or_else(|| "Server connection not found".to_string())?;
-
-        // Find the actual tool name (might be prefixed)
-        let actual_tool_name = conn
-            .tools
-            .iter()
-            .find(|t| {
-                t.name == tool_name
-                    || format!(
-                        "{}_{}",
-                        conn.server_name.replace(' ', "_").to_lowercase(),
-                        t.name
-                    ) == tool_name
-            })
-            .map(|t| t.name.clone())
-            .ok_or_else(|| format!("Tool '{}' not found on server", tool_name))?;
+            .get(*server_idx)
+            .ok_or_else(|| "Server connection not found".to_string())?
+            .lock()
+            .unwrap_or_else(|e| e.into_inner());
+
+        Self::call_on_connection(&mut conn, actual_tool_name, arguments, true)
+    }
 
+    /// Internal implementation of call_tool with optional retry on broken pipe.
+    fn call_on_connection(
+        conn: &mut McpConnection,
+        actual_tool_name: &str,
+        arguments: Value,
+        allow_retry: bool,
+    ) -> Result<Value, String> {
         info!(
             "Calling MCP tool '{}' on server '{}'",
             actual_tool_name, conn.server_name
@@ -462,9 +618,14 @@ impl McpClient {
                         Ok(new_conn) => {
                             info!("Successfully restarted MCP server '{}'", server_name);
                             // Replace the old connection
-                            self.connections[server_idx] = new_conn;
+                            *conn = new_conn;
                             // Retry the tool call (without allowing another retry)
-                            return self.call_tool_with_retry(tool_name, arguments, false);
+                            return Self::call_on_connection(
+                                conn,
+                                actual_tool_name,
+                                arguments,
+                                false,
+                            );
                         }
                         Err(restart_err) => {
                             warn!(
@@ -484,20 +645,7 @@ impl McpClient {
         }
         send_result?;
 
-        let conn = self
-            .connections
-            .get_mut(server_idx)
-            .ok_or_else(|| "Server connection not found after send".to_string())?;
-
-        let stdout = conn
-            .child
-            .stdout
-            .take()
-            .ok_or_else(|| "Server stdout not available".to_string())?;
-        let mut reader = BufReader::new(stdout);
-
-        let response = Self::read_response(&mut reader)?;
-        conn.child.stdout = Some(reader.into_inner());
+        let response = Self::read_response(&mut conn.reader)?;
 
         let call_duration = call_start.elapsed();
         if call_duration > Duration::from_secs(30) {
@@ -555,7 +703,64 @@ impl McpClient {
 
     /// Get the total number of available tools.
     pub fn tool_count(&self) -> usize {
-        self.connections.iter().map(|c| c.tools.len()).sum()
+        self.tools.len()
+    }
+}
+
+#[cfg(test)]
+impl McpClient {
+    /// A client over fake stdio servers, one per name, each providing the tool
+    /// `<name>_tool`. A fake server answers every request with `ok <name>`
+    /// after `delay`.
+    pub(crate) fn with_fake_servers(names: &[&str], delay: Duration) -> Self {
+        let mut connections = Vec::new();
+        let mut tools = Vec::new();
+        let mut tool_routes = HashMap::new();
+        for (server_idx, name) in names.iter().enumerate() {
+            let script = format!(
+                r#"while read line; do sleep {}; echo '{{"jsonrpc":"2.0","id":1,"result":{{"content":[{{"type":"text","text":"ok {}"}}]}}}}'; done"#,
+                delay.as_secs_f64(),
+                name
+            );
+            let mut child = Command::new("sh")
+                .args(["-c", &script])
+                .stdin(Stdio::piped())
+                .stdout(Stdio::piped())
+                .spawn()
+                .expect("failed to spawn fake MCP server");
+            let reader = BufReader::new(child.stdout.take().unwrap());
+            let tool = McpTool {
+                name: format!("{}_tool", name),
+                description: None,
+                input_schema: json!({"type": "object"}),
+            };
+            tool_routes.insert(tool.name.clone(), (server_idx, tool.name.clone()));
+            tools.push(McpToolWithServer {
+                server_name: name.to_string(),
+                server_id: name.to_string(),
+                tool: tool.clone(),
+            });
+            connections.push(Mutex::new(McpConnection {
+                server_name: name.to_string(),
+                server_id: name.to_string(),
+                child,
+                reader,
+                tools: vec![tool],
+                config: McpServerConfig {
+                    id: name.to_string(),
+                    name: name.to_string(),
+                    enabled: true,
+                    config: json!({}),
+                    last_used: None,
+                },
+            }));
+        }
+        Self {
+            connections,
+            tools,
+            tool_routes,
+            closed: AtomicBool::new(false),
+        }
     }
 }
 
@@ -582,6 +787,15 @@ impl McpToolWithServer {
     }
 }
 
+/// Parse a `Content-Length: N` header line, if that is what `line` is.
+fn parse_content_length(line: &str) -> Option<usize> {
+    let (name, value) = line.split_once(':')?;
+    if !name.trim().eq_ignore_ascii_case("content-length") {
+        return None;
+    }
+    value.trim().parse().ok()
+}
+
 /// Read MCP server configurations from the config file.
 pub fn load_mcp_servers() -> Result<Vec<McpServerConfig>, String> {
     let home = dirs::home_dir().ok_or_else(|| "Could not find home directory".to_string())?;
@@ -593,24 +807,76 @@ pub fn load_mcp_servers() -> Result<Vec<McpServerConfig>, String> {
         return Ok(Vec::new());
     }
 
-    let content = std::fs::read_to_string(&config_path)
-        .map_err(|e| format!("Failed to read MCP servers config: {}", e))?;
-
-    #[derive(Deserialize)]
+    #[derive(Clone, Deserialize)]
     struct ConfigFile {
         servers: Vec<McpServerConfig>,
     }
 
-    let config: ConfigFile = serde_json::from_str(&content)
-        .map_err(|e| format!("Failed to parse MCP servers config: {}", e))?;
+    let config: ConfigFile = crate::config::read_json_cached(&config_path, "MCP servers config")?;
 
     Ok(config.servers)
 }
 
+/// `load_mcp_servers` for async callers. The config read is file I/O, so it
+/// runs on the blocking pool instead of stalling the async runtime.
+pub async fn load_mcp_servers_async() -> Result<Vec<McpServerConfig>, String> {
+    tokio::task::spawn_blocking(load_mcp_servers)
+        .await
+        .map_err(|e| format!("MCP config load task failed: {}", e))?
+}
+
+/// Render a tool result for the model: text as-is, anything else as compact
+/// JSON (the model reads it fine and it costs fewer tokens than pretty-printed).
+pub fn tool_result_text(result: Value) -> String {
+    match result {
+        Value::String(text) => text,
+        other => other.to_string(),
+    }
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_tool_result_text() {
+        assert_eq!(tool_result_text(json!("plain text")), "plain text");
+        assert_eq!(
+            tool_result_text(json!({"items": [1, 2]})),
+            r#"{"items":[1,2]}"#
+        );
+    }
+
+    #[test]
+    fn test_read_response_newline_and_content_length_framing() {
+        let body = r#"{"jsonrpc":"2.0","id":2,"result":{}}"#;
+        let input = format!(
+            "{}\n\n{}\nContent-Length: {}\r\n\r\n{}",
+            r#"{"jsonrpc":"2.0","method":"notifications/progress"}"#,
+            r#"{"jsonrpc":"2.0","id":1,"result":{}}"#,
+            body.len(),
+            body
+        );
+        let mut reader = std::io::Cursor::new(input.into_bytes());
+
+        assert_eq!(McpClient::read_response(&mut reader).unwrap()["id"], 1);
+        assert_eq!(McpClient::read_response(&mut reader).unwrap()["id"], 2);
+        assert!(McpClient::read_response(&mut reader).is_err());
+    }
+
+    #[test]
+    fn test_send_batch_writes_one_line_per_message() {
+        let a = json!({"jsonrpc": "2.0", "method": "notifications/initialized"});
+        let b = json!({"jsonrpc": "2.0", "id": 7, "method": "tools/list"});
+        let mut buf: Vec<u8> = Vec::new();
+        McpClient::send_batch(&mut buf, &[&a, &b]).unwrap();
+
+        let text = String::from_utf8(buf).unwrap();
+        let lines: Vec<&str> = text.lines().collect();
+        assert_eq!(lines.len(), 2);
+        assert_eq!(serde_json::from_str::<Value>(lines[1]).unwrap()["id"], 7);
+    }
+
     #[test]
     fn test_mcp_tool_to_anthropic() {
         let tool = McpToolWithServer {
@@ -693,12 +959,33 @@ mod tests {
         );
     }
 
+    #[test]
+    #[cfg(unix)]
+    fn test_calls_to_different_servers_overlap() {
+        let client = McpClient::with_fake_servers(&["a", "b"], Duration::from_millis(500));
+        let start = std::time::Instant::now();
+        let (a, b) = std::thread::scope(|s| {
+            let a = s.spawn(|| client.call_tool("a_tool", json!({})));
+            let b = s.spawn(|| client.call_tool("b_tool", json!({})));
+            (a.join().unwrap(), b.join().unwrap())
+        });
+        assert_eq!(a.unwrap(), json!("ok a"));
+        assert_eq!(b.unwrap(), json!("ok b"));
+        // Serialized on one lock this would take at least a full second
+        assert!(start.elapsed() < Duration::from_millis(900));
+
+        client.shutdown();
+        assert!(client.call_tool("a_tool", json!({})).is_err());
+    }
+
     #[test]
     fn test_mcp_client_empty_connections() {
         // Test that an empty MCP client reports 0 servers and tools
         let client = McpClient {
             connections: vec![],
+            tools: vec![],
             tool_routes: std::collections::HashMap::new(),
+            closed: AtomicBool::new(false),
         };
 
         assert_eq!(client.server_count(), 0);
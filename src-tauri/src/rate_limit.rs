@@ -0,0 +1,159 @@
+//! Client-side rate limiting for Anthropic API calls.
+//!
+//! Concurrent topic research can issue requests faster than the account's
+//! per-minute limits allow, which turns into bursts of 429s and backoff.
+//! `RateLimiter` paces calls to stay under a requests-per-minute budget and,
+//! optionally, a tokens-per-minute budget, so the retry loop is the exception
+//! rather than the steady state.
+
+use std::collections::VecDeque;
+use std::sync::Mutex;
+use std::time::{Duration, Instant};
+use tracing::debug;
+
+const WINDOW: Duration = Duration::from_secs(60);
+
+/// Requests are allowed to burst up to this many seconds' worth of the
+/// per-minute budget before being spaced out.
+const BURST_SECS: u32 = 10;
+
+/// Paces API calls to a requests-per-minute and tokens-per-minute budget.
+/// A budget of 0 disables that limit.
+pub struct RateLimiter {
+    requests_per_minute: u32,
+    tokens_per_minute: u32,
+    state: Mutex<LimiterState>,
+}
+
+struct LimiterState {
+    /// Request permits available now (token bucket, refilled continuously)
+    permits: f64,
+    refilled_at: Instant,
+    /// Tokens used by responses within the last minute, oldest first
+    token_usage: VecDeque<(Instant, u32)>,
+    tokens_in_window: u64,
+}
+
+impl RateLimiter {
+    pub fn new(requests_per_minute: u32, tokens_per_minute: u32) -> Self {
+        Self {
+            requests_per_minute,
+            tokens_per_minute,
+            state: Mutex::new(LimiterState {
+                permits: burst_capacity(requests_per_minute),
+                refilled_at: Instant::now(),
+                token_usage: VecDeque::new(),
+                tokens_in_window: 0,
+            }),
+        }
+    }
+
+    /// No limits at all.
+    pub fn unlimited() -> Self {
+        Self::new(0, 0)
+    }
+
+    /// Wait until a request fits within both budgets, then claim it.
+    pub async fn acquire(&self) {
+        loop {
+            let wait = match self.try_acquire(Instant::now()) {
+                Ok(()) => return,
+                Err(wait) => wait,
+            };
+            debug!("Rate limit reached, waiting {:.1}s", wait.as_secs_f64());
+            tokio::time::sleep(wait).await;
+        }
+    }
+
+    /// Record the tokens a response used, for the tokens-per-minute budget.
+    pub fn record_tokens(&self, tokens: u32) {
+        if self.tokens_per_minute == 0 {
+            return;
+        }
+        let mut state = self.lock_state();
+        state.token_usage.push_back((Instant::now(), tokens));
+        state.tokens_in_window += u64::from(tokens);
+    }
+
+    /// Claim a request at `now`, or say how long to wait before trying again.
+    fn try_acquire(&self, now: Instant) -> Result<(), Duration> {
+        let mut state = self.lock_state();
+
+        if self.tokens_per_minute > 0 {
+            while let Some(&(at, tokens)) = state.token_usage.front() {
+                if now.duration_since(at) < WINDOW {
+                    break;
+                }
+                state.token_usage.pop_front();
+                state.tokens_in_window -= u64::from(tokens);
+            }
+            if state.tokens_in_window >= u64::from(self.tokens_per_minute) {
+                // Wait for the oldest usage to leave the window
+                let oldest = state.token_usage.front().map_or(now, |&(at, _)| at);
+                return Err((oldest + WINDOW).saturating_duration_since(now));
+            }
+        }
+
+        if self.requests_per_minute > 0 {
+            let per_sec = f64::from(self.requests_per_minute) / WINDOW.as_secs_f64();
+            let elapsed = now.duration_since(state.refilled_at).as_secs_f64();
+            state.permits =
+                (state.permits + elapsed * per_sec).min(burst_capacity(self.requests_per_minute));
+            state.refilled_at = now;
+            if state.permits < 1.0 {
+                return Err(Duration::from_secs_f64((1.0 - state.permits) / per_sec));
+            }
+            state.permits -= 1.0;
+        }
+
+        Ok(())
+    }
+
+    fn lock_state(&self) -> std::sync::MutexGuard<'_, LimiterState> {
+        self.state.lock().unwrap_or_else(|e| e.into_inner())
+    }
+}
+
+fn burst_capacity(requests_per_minute: u32) -> f64 {
+    f64::from((requests_per_minute.saturating_mul(BURST_SECS) / 60).max(1))
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_request_budget_bursts_then_spaces_out() {
+        // 60 RPM: a burst of 10, then one request per second
+        let limiter = RateLimiter::new(60, 0);
+        let start = Instant::now();
+        for _ in 0..10 {
+            assert!(limiter.try_acquire(start).is_ok());
+        }
+        let wait = limiter.try_acquire(start).unwrap_err();
+        assert!(wait <= Duration::from_secs(1) && wait > Duration::from_millis(900));
+        assert!(limiter.try_acquire(start + Duration::from_secs(1)).is_ok());
+    }
+
+    #[test]
+    fn test_token_budget_waits_for_window() {
+        let limiter = RateLimiter::new(0, 1000);
+        assert!(limiter.try_acquire(Instant::now()).is_ok());
+        limiter.record_tokens(1200);
+
+        let now = Instant::now();
+        let wait = limiter.try_acquire(now).unwrap_err();
+        assert!(wait > Duration::from_secs(59));
+        assert!(limiter.try_acquire(now + WINDOW).is_ok());
+    }
+
+    #[test]
+    fn test_unlimited_never_waits() {
+        let limiter = RateLimiter::unlimited();
+        let now = Instant::now();
+        for _ in 0..1000 {
+            limiter.record_tokens(100_000);
+            assert!(limiter.try_acquire(now).is_ok());
+        }
+    }
+}
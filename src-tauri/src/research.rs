@@ -4,17 +4,25 @@
 //! Supports tool calling for external data sources via MCP servers and built-in tools.
 #![allow(dead_code)]
 
-use crate::mcp_client::{load_mcp_servers, McpClient};
+use crate::mcp_client::{load_mcp_servers, load_mcp_servers_async, tool_result_text, McpClient};
+use crate::rate_limit::RateLimiter;
 use crate::research_log::{parse_api_error, ErrorCode, ResearchError, ResearchLogger};
 use crate::research_state;
 use chrono::Datelike;
+use futures::future;
+use futures::stream::{self, StreamExt};
+use lazy_static::lazy_static;
 use regex::Regex;
 use reqwest::Client;
 use serde::{Deserialize, Serialize};
 use serde_json::json;
-use std::collections::HashSet;
-use std::sync::atomic::{AtomicBool, Ordering};
-use std::sync::Arc;
+use std::collections::hash_map::RandomState;
+use std::collections::{HashMap, HashSet};
+use std::fmt::Write as _;
+use std::hash::{BuildHasher, Hasher};
+use std::sync::atomic::{AtomicBool, AtomicUsize, Ordering};
+use std::sync::mpsc;
+use std::sync::{Arc, Mutex};
 use std::time::{Duration, Instant};
 use tauri::Emitter;
 use tracing::{debug, error, info, warn};
@@ -22,6 +30,37 @@ use tracing::{debug, error, info, warn};
 /// Maximum number of tool use iterations to prevent infinite loops.
 const MAX_TOOL_ITERATIONS: usize = 10;
 
+/// Retry policy for transient Anthropic API failures (429, 5xx/529, network):
+/// up to `API_MAX_ATTEMPTS` tries with full-jitter exponential backoff, unless
+/// the server says how long to wait via `retry-after`.
+const API_MAX_ATTEMPTS: u32 = 5;
+const API_RETRY_BASE: Duration = Duration::from_secs(1);
+const API_RETRY_CAP: Duration = Duration::from_secs(30);
+
+/// How often a backoff or polling wait checks whether the run was cancelled.
+const CANCEL_CHECK_INTERVAL: Duration = Duration::from_millis(250);
+
+/// Message Batches API polling backoff: the first status check waits
+/// `BATCH_POLL_INITIAL`, doubling up to `BATCH_POLL_MAX` between checks.
+const BATCH_POLL_INITIAL: Duration = Duration::from_secs(5);
+const BATCH_POLL_MAX: Duration = Duration::from_secs(60);
+
+/// How long a topic's research result is reused by later runs. Matches the
+/// "last 24-48 hours" freshness the research prompt asks for.
+const TOPIC_CACHE_TTL_SECS: i64 = 6 * 60 * 60;
+
+/// Summary returned when the tool loop hits MAX_TOOL_ITERATIONS (never cached).
+const MAX_ITERATIONS_SUMMARY: &str = "Research completed (max iterations reached)";
+
+/// Maximum number of topics researched at once. Each topic is a multi-request
+/// tool-use conversation, so a small bound keeps us within API rate limits.
+const MAX_CONCURRENT_TOPICS: usize = 3;
+
+/// How long a successful tool result is reused within a run. Topics often
+/// repeat the same lookup (a repo's commits, a calendar day), and that data
+/// barely moves over a few minutes.
+const TOOL_RESULT_CACHE_TTL: Duration = Duration::from_secs(5 * 60);
+
 /// Claude's built-in web search tool type identifier.
 /// This version string may change with API updates.
 const WEB_SEARCH_TOOL_TYPE: &str = "web_search_20250305";
@@ -29,6 +68,50 @@ const WEB_SEARCH_TOOL_TYPE: &str = "web_search_20250305";
 /// Maximum number of web searches per topic to control costs (~$0.01/search).
 const WEB_SEARCH_MAX_USES: u32 = 10;
 
+// Regexes are compiled once on first use instead of on every call.
+// Use (?s) flag for DOTALL mode to match across newlines.
+lazy_static! {
+    static ref SCRIPT_TAG_RE: Regex = Regex::new(r"(?is)<script[^>]*>.*?</script>").unwrap();
+    static ref STYLE_TAG_RE: Regex = Regex::new(r"(?is)<style[^>]*>.*?</style>").unwrap();
+    static ref HTML_TAG_RE: Regex = Regex::new(r"<[^>]+>").unwrap();
+    static ref WHITESPACE_RE: Regex = Regex::new(r"\s+").unwrap();
+    static ref TOPIC_DELIMITER_RE: Regex = Regex::new(r"<<<TOPIC (\d+)>>>").unwrap();
+    // Tool name classes. Names are matched by substring because MCP tools may
+    // be prefixed with their server name (e.g. "Firecrawl:firecrawl_search").
+    static ref EXPENSIVE_TOOL_RE: Regex = Regex::new(r"firecrawl_agent").unwrap();
+    static ref FIRECRAWL_TOOL_RE: Regex =
+        Regex::new(r"firecrawl_(search|scrape|extract|map|crawl)").unwrap();
+    static ref STANDARD_SEARCH_TOOL_RE: Regex =
+        Regex::new(r"brave_search|brave_web_search|perplexity_ask|fetch_webpage").unwrap();
+    /// Firecrawl tools that return page content (and accept onlyMainContent)
+    static ref FIRECRAWL_CONTENT_TOOL_RE: Regex =
+        Regex::new(r"firecrawl_(scrape|search|extract|crawl)").unwrap();
+}
+
+/// How research_mode filtering treats a tool, by name.
+#[derive(Debug, Clone, Copy, PartialEq, Eq)]
+enum ToolClass {
+    /// Always excluded (firecrawl_agent uses 100s of credits per call)
+    Expensive,
+    /// Only offered in firecrawl mode
+    Firecrawl,
+    /// Standard search tools, excluded in firecrawl mode
+    StandardSearch,
+    Other,
+}
+
+fn classify_tool(name: &str) -> ToolClass {
+    if EXPENSIVE_TOOL_RE.is_match(name) {
+        ToolClass::Expensive
+    } else if FIRECRAWL_TOOL_RE.is_match(name) {
+        ToolClass::Firecrawl
+    } else if STANDARD_SEARCH_TOOL_RE.is_match(name) {
+        ToolClass::StandardSearch
+    } else {
+        ToolClass::Other
+    }
+}
+
 /// A single briefing card containing research on a topic.
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct BriefingCard {
@@ -196,6 +279,62 @@ fn get_timestamp() -> String {
     chrono::Utc::now().to_rfc3339()
 }
 
+/// A line for `~/.claudius/research-debug.log`. `Reset` starts a fresh log
+/// for a new run.
+enum DebugLogRecord {
+    Reset(String),
+    Append(String),
+}
+
+lazy_static! {
+    /// Queue feeding a dedicated writer thread, so the research path never
+    /// waits on disk for debug output. One writer keeps lines in order.
+    static ref DEBUG_LOG: Mutex<mpsc::Sender<DebugLogRecord>> = {
+        let (tx, rx) = mpsc::channel::<DebugLogRecord>();
+        std::thread::spawn(move || {
+            let Some(log_path) =
+                dirs::home_dir().map(|home| home.join(".claudius").join("research-debug.log"))
+            else {
+                return;
+            };
+            for record in rx {
+                let _ = match record {
+                    DebugLogRecord::Reset(line) => std::fs::write(&log_path, line),
+                    DebugLogRecord::Append(line) => std::fs::OpenOptions::new()
+                        .append(true)
+                        .open(&log_path)
+                        .and_then(|mut f| std::io::Write::write_all(&mut f, line.as_bytes())),
+                };
+            }
+        });
+        Mutex::new(tx)
+    };
+}
+
+fn send_debug_log(record: DebugLogRecord) {
+    if let Ok(tx) = DEBUG_LOG.lock() {
+        let _ = tx.send(record);
+    }
+}
+
+/// Append a timestamped line to the research debug log.
+fn debug_log(message: impl std::fmt::Display) {
+    send_debug_log(DebugLogRecord::Append(format!(
+        "{}: {}\n",
+        chrono::Local::now(),
+        message
+    )));
+}
+
+/// Truncate the research debug log, starting it with `message`.
+fn reset_debug_log(message: impl std::fmt::Display) {
+    send_debug_log(DebugLogRecord::Reset(format!(
+        "{}: {}\n",
+        chrono::Local::now(),
+        message
+    )));
+}
+
 // ============================================================================
 // Anthropic API Types with Tool Support
 // ============================================================================
@@ -208,17 +347,211 @@ struct Tool {
     input_schema: serde_json::Value,
 }
 
+/// A server-sent event from a streaming Messages API response.
+#[derive(Debug, Deserialize)]
+#[serde(tag = "type", rename_all = "snake_case")]
+enum StreamEvent {
+    MessageStart {
+        message: StreamMessageStart,
+    },
+    ContentBlockStart {
+        index: usize,
+        content_block: ResponseContentBlock,
+    },
+    ContentBlockDelta {
+        index: usize,
+        delta: StreamDelta,
+    },
+    MessageDelta {
+        delta: StreamMessageDelta,
+        usage: StreamDeltaUsage,
+    },
+    /// Same shape as an API error response body (carried in `error`).
+    Error {
+        error: serde_json::Value,
+    },
+    /// content_block_stop, message_stop, ping, and event types added later.
+    #[serde(other)]
+    Other,
+}
+
+#[derive(Debug, Deserialize)]
+struct StreamMessageStart {
+    usage: Usage,
+}
+
+#[derive(Debug, Deserialize)]
+#[serde(tag = "type", rename_all = "snake_case")]
+enum StreamDelta {
+    TextDelta {
+        text: String,
+    },
+    #[serde(other)]
+    Other,
+}
+
+#[derive(Debug, Deserialize)]
+struct StreamMessageDelta {
+    stop_reason: Option<String>,
+}
+
+#[derive(Debug, Deserialize)]
+struct StreamDeltaUsage {
+    output_tokens: u32,
+}
+
+/// Splits a server-sent event byte stream into event `data` payloads.
+#[derive(Default)]
+struct SseDecoder {
+    buffer: Vec<u8>,
+}
+
+impl SseDecoder {
+    /// Feed a chunk of the response body; returns the data of every event the
+    /// chunk completed. Partial events stay buffered for the next chunk.
+    fn push(&mut self, chunk: &[u8]) -> Vec<String> {
+        self.buffer.extend_from_slice(chunk);
+        let mut events = Vec::new();
+        while let Some(end) = self.buffer.windows(2).position(|w| w == b"\n\n") {
+            let raw: Vec<u8> = self.buffer.drain(..end + 2).collect();
+            let raw = String::from_utf8_lossy(&raw);
+            let data: Vec<&str> = raw
+                .lines()
+                .filter_map(|line| line.strip_prefix("data:"))
+                .map(|d| d.strip_prefix(' ').unwrap_or(d))
+                .collect();
+            if !data.is_empty() {
+                events.push(data.join("\n"));
+            }
+        }
+        events
+    }
+}
+
+/// Counts briefing cards as synthesis output streams in: every object that
+/// closes directly inside the top-level object's array is one card.
+#[derive(Default)]
+struct CardProgress {
+    depth: usize,
+    in_string: bool,
+    escaped: bool,
+    cards: usize,
+}
+
+impl CardProgress {
+    /// Feed more output text; returns true if it completed at least one card.
+    fn feed(&mut self, text: &str) -> bool {
+        let before = self.cards;
+        for c in text.chars() {
+            if self.in_string {
+                match c {
+                    _ if self.escaped => self.escaped = false,
+                    '\\' => self.escaped = true,
+                    '"' => self.in_string = false,
+                    _ => {}
+                }
+                continue;
+            }
+            match c {
+                '"' => self.in_string = true,
+                '{' => self.depth += 1,
+                '}' => {
+                    if self.depth == 2 {
+                        self.cards += 1;
+                    }
+                    self.depth = self.depth.saturating_sub(1);
+                }
+                _ => {}
+            }
+        }
+        self.cards > before
+    }
+}
+
+/// The tool set for a research run, in the forms each topic needs. Built once
+/// per run so topics and tool-loop iterations don't re-derive it from MCP state.
+struct RunTools {
+    /// "- name: description" lines for the research system prompt
+    descriptions: String,
+    /// Tool definitions sent with every request (including web_search if enabled)
+    json: Vec<serde_json::Value>,
+    /// Sorted, comma-separated tool names, for the topic cache key
+    names_key: String,
+    /// MCP tool name -> server name, for logging tool calls
+    mcp_servers: HashMap<String, String>,
+}
+
+/// Research prompts for a run. Only the topic list differs between topics, so
+/// the system prompt and the user prompt around the topics are formatted once.
+struct ResearchPrompts {
+    system: Vec<SystemBlock>,
+    /// User prompt text before and after the topic section
+    user_head: String,
+    user_tail: String,
+    /// The run's date (YYYY-MM-DD); research is only reused within a day
+    date: String,
+}
+
+impl ResearchPrompts {
+    fn user_prompt(&self, topics: &[String]) -> String {
+        let section = topic_prompt_section(topics);
+        let mut prompt =
+            String::with_capacity(self.user_head.len() + section.len() + self.user_tail.len());
+        prompt.push_str(&self.user_head);
+        prompt.push_str(&section);
+        prompt.push_str(&self.user_tail);
+        prompt
+    }
+}
+
 /// Anthropic API message request with tools.
 /// Note: `tools` uses serde_json::Value to support both regular tools and server tools (like web_search)
+/// Fields are borrowed so the tool loop doesn't copy the growing conversation
+/// (and the tool list) into every iteration's request.
 #[derive(Debug, Serialize)]
-struct AnthropicRequest {
-    model: String,
+struct AnthropicRequest<'a> {
+    model: &'a str,
     max_tokens: u32,
-    messages: Vec<Message>,
+    messages: &'a [Message],
+    #[serde(skip_serializing_if = "Option::is_none")]
+    tools: Option<&'a [serde_json::Value]>,
     #[serde(skip_serializing_if = "Option::is_none")]
-    tools: Option<Vec<serde_json::Value>>,
+    system: Option<&'a [SystemBlock]>,
+    /// Ask for a server-sent event stream (see `send_streaming_request`)
+    #[serde(skip_serializing_if = "std::ops::Not::not")]
+    stream: bool,
+}
+
+/// A text block of the system prompt.
+#[derive(Debug, Clone, Serialize)]
+struct SystemBlock {
+    #[serde(rename = "type")]
+    block_type: &'static str,
+    text: String,
     #[serde(skip_serializing_if = "Option::is_none")]
-    system: Option<String>,
+    cache_control: Option<CacheControl>,
+}
+
+/// Prompt cache breakpoint. Everything up to and including the marked block
+/// (tools, then system prompt) is cached, so repeated calls with the same
+/// prefix are billed and processed as cache reads.
+#[derive(Debug, Clone, Serialize)]
+struct CacheControl {
+    #[serde(rename = "type")]
+    cache_type: &'static str,
+}
+
+/// Build a system prompt whose content (and the tools before it) is marked
+/// for prompt caching. Keep per-call variables out of `text` and in the
+/// messages, or the cached prefix will never be reused.
+fn cached_system_prompt(text: String) -> Vec<SystemBlock> {
+    vec![SystemBlock {
+        block_type: "text",
+        text,
+        cache_control: Some(CacheControl {
+            cache_type: "ephemeral",
+        }),
+    }]
 }
 
 /// A message in the conversation.
@@ -265,25 +598,112 @@ struct AnthropicResponse {
     stop_reason: Option<String>,
 }
 
+impl AnthropicResponse {
+    fn text(&self) -> String {
+        join_text(&self.content)
+    }
+}
+
 /// Content block in API response (slightly different structure for deserialization).
+/// Shared with the chat module, which reads the same response shape.
 #[derive(Debug, Deserialize)]
-struct ResponseContentBlock {
+pub(crate) struct ResponseContentBlock {
     #[serde(rename = "type")]
-    content_type: String,
+    pub(crate) content_type: String,
     #[serde(default)]
-    text: Option<String>,
+    pub(crate) text: Option<String>,
     #[serde(default)]
-    id: Option<String>,
+    pub(crate) id: Option<String>,
     #[serde(default)]
-    name: Option<String>,
+    pub(crate) name: Option<String>,
     #[serde(default)]
-    input: Option<serde_json::Value>,
+    pub(crate) input: Option<serde_json::Value>,
+}
+
+/// Concatenate a response's text blocks, newline-separated, into one
+/// pre-sized buffer (no per-block String clones).
+pub(crate) fn join_text(blocks: &[ResponseContentBlock]) -> String {
+    let texts = || {
+        blocks
+            .iter()
+            .filter(|c| c.content_type == "text")
+            .filter_map(|c| c.text.as_deref())
+    };
+    let len: usize = texts().map(|t| t.len() + 1).sum();
+    let mut out = String::with_capacity(len);
+    for (i, text) in texts().enumerate() {
+        if i > 0 {
+            out.push('\n');
+        }
+        out.push_str(text);
+    }
+    out
 }
 
 #[derive(Debug, Deserialize)]
 struct Usage {
     input_tokens: u32,
     output_tokens: u32,
+    /// Prompt tokens written to the prompt cache (not included in `input_tokens`).
+    #[serde(default)]
+    cache_creation_input_tokens: u32,
+    /// Prompt tokens served from the prompt cache (not included in `input_tokens`).
+    #[serde(default)]
+    cache_read_input_tokens: u32,
+}
+
+impl Usage {
+    /// Total prompt + completion tokens, counting cached prompt tokens too so
+    /// totals stay comparable with uncached requests.
+    fn total(&self) -> u32 {
+        self.input_tokens
+            + self.cache_creation_input_tokens
+            + self.cache_read_input_tokens
+            + self.output_tokens
+    }
+}
+
+/// One request in a Message Batches API submission.
+#[derive(Debug, Serialize)]
+struct BatchRequestItem<'a> {
+    custom_id: &'a str,
+    params: &'a AnthropicRequest<'a>,
+}
+
+/// Message Batches API submission body.
+#[derive(Debug, Serialize)]
+struct BatchCreateRequest<'a> {
+    requests: Vec<BatchRequestItem<'a>>,
+}
+
+/// Message batch status, as returned on create and when polling.
+#[derive(Debug, Deserialize)]
+struct MessageBatch {
+    id: String,
+    processing_status: String, // "in_progress" | "canceling" | "ended"
+    #[serde(default)]
+    results_url: Option<String>,
+}
+
+/// One line of a message batch's JSONL results file.
+#[derive(Debug, Deserialize)]
+struct BatchResultLine {
+    custom_id: String,
+    result: BatchResult,
+}
+
+#[derive(Debug, Deserialize)]
+#[serde(tag = "type", rename_all = "snake_case")]
+enum BatchResult {
+    Succeeded {
+        message: AnthropicResponse,
+    },
+    /// `error` has the same shape as an API error response body.
+    Errored {
+        error: serde_json::Value,
+    },
+    Canceled,
+    Expired,
 }
 
 /// Response from Claude for briefing cards.
@@ -560,21 +980,11 @@ async fn execute_fetch_webpage(client: &Client, url: &str) -> Result<String, Str
 /// Simple HTML text extraction (removes tags, scripts, styles).
 fn extract_text_from_html(html: &str) -> String {
     // Remove script and style tags with content
-    let without_scripts = Regex::new(r"(?is)<script[^>]*>.*?</script>")
-        .ok()
-        .map(|re| re.replace_all(html, "").to_string())
-        .unwrap_or_else(|| html.to_string());
-
-    let without_styles = Regex::new(r"(?is)<style[^>]*>.*?</style>")
-        .ok()
-        .map(|re| re.replace_all(&without_scripts, "").to_string())
-        .unwrap_or_else(|| without_scripts.clone());
+    let without_scripts = SCRIPT_TAG_RE.replace_all(html, "");
+    let without_styles = STYLE_TAG_RE.replace_all(&without_scripts, "");
 
     // Remove HTML tags
-    let without_tags = Regex::new(r"<[^>]+>")
-        .ok()
-        .map(|re| re.replace_all(&without_styles, " ").to_string())
-        .unwrap_or_else(|| without_styles.clone());
+    let without_tags = HTML_TAG_RE.replace_all(&without_styles, " ");
 
     // Decode common HTML entities
     let decoded = without_tags
@@ -586,23 +996,32 @@ fn extract_text_from_html(html: &str) -> String {
         .replace("&#39;", "'");
 
     // Clean up whitespace
-    Regex::new(r"\s+")
-        .ok()
-        .map(|re| re.replace_all(&decoded, " ").trim().to_string())
-        .unwrap_or_else(|| decoded.trim().to_string())
+    WHITESPACE_RE.replace_all(&decoded, " ").trim().to_string()
 }
 
 // ============================================================================
 // Research Agent
 // ============================================================================
 
+/// Stops a run's MCP servers when the run ends, however it ends: returning,
+/// an error, a panic, or the run's future being dropped by a cancelled caller.
+struct McpShutdownGuard(Arc<McpClient>);
+
+impl Drop for McpShutdownGuard {
+    fn drop(&mut self) {
+        self.0.shutdown();
+    }
+}
+
 /// Research agent that calls Anthropic API with tool support.
 pub struct ResearchAgent {
     client: Client,
     api_key: String,
     model: String,
     github_token: Option<String>,
-    mcp_client: Option<McpClient>,
+    /// Shared so concurrent topics can route tool calls through the same servers
+    /// (each server's calls are serialized by the client, one stdio stream each)
+    mcp_client: Option<Arc<McpClient>>,
     /// Names of built-in tools (to differentiate from MCP tools)
     builtin_tools: HashSet<String>,
     /// Cancellation token for aborting research
@@ -613,6 +1032,16 @@ pub struct ResearchAgent {
     research_mode: String,
     /// Limit firecrawl_agent to 5 calls/day (free tier)
     rate_limit_firecrawl_agent: bool,
+    /// Topics packed into one research conversation (1 = one conversation per topic)
+    topics_per_request: usize,
+    /// Send synthesis through the Message Batches API (half price, not realtime)
+    use_batch_api: bool,
+    /// Skip the topic research cache and always research afresh
+    force_refresh: bool,
+    /// Successful tool results for this run, keyed by tool name and input
+    tool_cache: Mutex<HashMap<String, (Instant, String)>>,
+    /// Paces Claude API calls across concurrently researched topics
+    rate_limiter: RateLimiter,
 }
 
 impl ResearchAgent {
@@ -649,12 +1078,7 @@ impl ResearchAgent {
         }
 
         Self {
-            client: Client::builder()
-                .timeout(Duration::from_secs(180)) // 3 min total request timeout
-                .connect_timeout(Duration::from_secs(30)) // 30s to establish connection
-                .pool_idle_timeout(Duration::from_secs(60)) // Close idle connections after 60s
-                .build()
-                .expect("Failed to build HTTP client"),
+            client: crate::http::client(),
             api_key,
             model: model.unwrap_or_else(|| "claude-haiku-4-5-20251001".to_string()),
             github_token,
@@ -664,9 +1088,58 @@ impl ResearchAgent {
             enable_web_search,
             research_mode,
             rate_limit_firecrawl_agent,
+            topics_per_request: 1,
+            use_batch_api: false,
+            force_refresh: false,
+            tool_cache: Mutex::new(HashMap::new()),
+            rate_limiter: RateLimiter::unlimited(),
         }
     }
 
+    /// Cap Claude API requests and tokens per minute (0 = no limit), so
+    /// concurrent topics queue locally instead of tripping 429s.
+    pub fn set_rate_limits(&mut self, requests_per_minute: u32, tokens_per_minute: u32) {
+        self.rate_limiter = RateLimiter::new(requests_per_minute, tokens_per_minute);
+    }
+
+    /// Ignore cached topic research from recent runs (results are still cached).
+    pub fn set_force_refresh(&mut self, force_refresh: bool) {
+        self.force_refresh = force_refresh;
+    }
+
+    /// Cache key for a topic group's research. Covers everything that shapes
+    /// the research: the run's date, model, mode, web search and the tool set.
+    fn topic_cache_key(
+        &self,
+        topics: &[String],
+        tools: &RunTools,
+        prompts: &ResearchPrompts,
+    ) -> String {
+        format!(
+            "{}|{}|{}|{}|{}|{}",
+            prompts.date,
+            self.model,
+            self.research_mode,
+            self.enable_web_search,
+            tools.names_key,
+            topics.join("\n")
+        )
+    }
+
+    /// Send synthesis through the Message Batches API instead of the realtime
+    /// endpoint. Batches cost about half as much but may take minutes (up to
+    /// 24h) to complete, so only enable this for unattended runs.
+    pub fn set_use_batch_api(&mut self, use_batch_api: bool) {
+        self.use_batch_api = use_batch_api;
+    }
+
+    /// Set how many topics are researched together in one Claude conversation.
+    /// Grouping amortizes the shared prompt and cuts request count, at the cost
+    /// of a shallower tool-use budget per topic.
+    pub fn set_topics_per_request(&mut self, topics_per_request: usize) {
+        self.topics_per_request = topics_per_request.max(1);
+    }
+
     /// Set the cancellation token for this agent
     pub fn set_cancellation_token(&mut self, token: Arc<AtomicBool>) {
         self.cancellation_token = Some(token);
@@ -711,9 +1184,25 @@ impl ResearchAgent {
         Ok(())
     }
 
+    /// A result for the same tool call made earlier in this run, if still fresh.
+    fn cached_tool_result(&self, key: &str) -> Option<String> {
+        let cache = self.tool_cache.lock().unwrap_or_else(|e| e.into_inner());
+        cache
+            .get(key)
+            .filter(|(stored_at, _)| stored_at.elapsed() < TOOL_RESULT_CACHE_TTL)
+            .map(|(_, output)| output.clone())
+    }
+
+    fn cache_tool_result(&self, key: String, output: &str) {
+        self.tool_cache
+            .lock()
+            .unwrap_or_else(|e| e.into_inner())
+            .insert(key, (Instant::now(), output.to_string()));
+    }
+
     /// Initialize MCP connections to configured servers.
     pub async fn init_mcp(&mut self) -> Result<(), String> {
-        match load_mcp_servers() {
+        match load_mcp_servers_async().await {
             Ok(servers) => {
                 let enabled_count = servers.iter().filter(|s| s.enabled).count();
                 if enabled_count == 0 {
@@ -729,7 +1218,7 @@ impl ResearchAgent {
                             client.server_count(),
                             client.tool_count()
                         );
-                        self.mcp_client = Some(client);
+                        self.mcp_client = Some(Arc::new(client));
                         Ok(())
                     }
                     Err(e) => {
@@ -750,31 +1239,12 @@ impl ResearchAgent {
     /// Get all available tools (built-in + MCP), filtered by research_mode.
     fn get_all_tools(&self) -> Vec<Tool> {
         let mut tools = Vec::new();
-
-        // Firecrawl tool names to filter
-        let firecrawl_tools = [
-            "firecrawl_search",
-            "firecrawl_scrape",
-            "firecrawl_extract",
-            "firecrawl_map",
-            "firecrawl_crawl",
-        ];
-        // Standard search tools to exclude in firecrawl mode
-        let standard_search_tools = [
-            "brave_search",
-            "brave_web_search",
-            "perplexity_ask",
-            "fetch_webpage",
-        ];
-        // Expensive tools to always exclude (firecrawl_agent uses 100s of credits per call)
-        let expensive_tools = ["firecrawl_agent"];
+        let firecrawl_mode = self.research_mode == "firecrawl";
 
         // Add built-in tools (filtered by mode)
         for tool in get_research_tools() {
             // In firecrawl mode, exclude the built-in fetch_webpage
-            if self.research_mode == "firecrawl"
-                && standard_search_tools.contains(&tool.name.as_str())
-            {
+            if firecrawl_mode && classify_tool(&tool.name) == ToolClass::StandardSearch {
                 tracing::debug!("Excluding built-in tool '{}' in firecrawl mode", tool.name);
                 continue;
             }
@@ -782,38 +1252,30 @@ impl ResearchAgent {
         }
 
         // Add MCP tools (filtered by mode)
-        if let Some(ref mcp_client) = self.mcp_client {
+        if let Some(mcp_client) = self.mcp_client.as_deref() {
             for mcp_tool in mcp_client.get_all_tools() {
                 let tool_name = &mcp_tool.tool.name;
 
-                // Always exclude expensive tools
-                if expensive_tools.iter().any(|et| tool_name.contains(et)) {
-                    tracing::debug!(
-                        "Excluding expensive tool '{}' (high credit usage)",
-                        tool_name
-                    );
-                    continue;
-                }
-
-                // Filter based on research mode
-                let dominated_by_firecrawl =
-                    firecrawl_tools.iter().any(|ft| tool_name.contains(ft));
-                let is_standard_search = standard_search_tools
-                    .iter()
-                    .any(|st| tool_name.contains(st));
-
-                if self.research_mode == "firecrawl" {
+                match (classify_tool(tool_name), firecrawl_mode) {
+                    // Always exclude expensive tools
+                    (ToolClass::Expensive, _) => {
+                        tracing::debug!(
+                            "Excluding expensive tool '{}' (high credit usage)",
+                            tool_name
+                        );
+                        continue;
+                    }
                     // In firecrawl mode, exclude standard search tools
-                    if is_standard_search {
+                    (ToolClass::StandardSearch, true) => {
                         tracing::debug!("Excluding tool '{}' in firecrawl mode", tool_name);
                         continue;
                     }
-                } else {
                     // In standard mode, exclude firecrawl tools
-                    if dominated_by_firecrawl {
+                    (ToolClass::Firecrawl, false) => {
                         tracing::debug!("Excluding tool '{}' in standard mode", tool_name);
                         continue;
                     }
+                    _ => {}
                 }
 
                 tools.push(Tool {
@@ -834,10 +1296,24 @@ impl ResearchAgent {
         tools
     }
 
-    /// Get all tools as JSON values for API request, including web_search if enabled.
-    fn get_tools_json(&self) -> Vec<serde_json::Value> {
+    /// Snapshot the available tools (built-in + MCP, filtered by research_mode)
+    /// for a run, with web_search added to the API definitions if enabled.
+    fn run_tools(&self) -> RunTools {
         let tools = self.get_all_tools();
-        let mut tools_json: Vec<serde_json::Value> = tools
+
+        let mut descriptions = String::new();
+        for t in &tools {
+            if !descriptions.is_empty() {
+                descriptions.push('\n');
+            }
+            let _ = write!(descriptions, "- {}: {}", t.name, t.description);
+        }
+
+        let mut names: Vec<&str> = tools.iter().map(|t| t.name.as_str()).collect();
+        names.sort_unstable();
+        let names_key = names.join(",");
+
+        let mut json: Vec<serde_json::Value> = tools
             .iter()
             .map(|t| {
                 serde_json::json!({
@@ -850,7 +1326,7 @@ impl ResearchAgent {
 
         // Add Claude's built-in web search tool if enabled
         if self.enable_web_search {
-            tools_json.push(serde_json::json!({
+            json.push(serde_json::json!({
                 "type": WEB_SEARCH_TOOL_TYPE,
                 "name": "web_search",
                 "max_uses": WEB_SEARCH_MAX_USES
@@ -858,7 +1334,126 @@ impl ResearchAgent {
             tracing::debug!("Added web_search tool to request");
         }
 
-        tools_json
+        let mcp_servers = self
+            .mcp_client
+            .as_deref()
+            .map(|client| {
+                client
+                    .get_all_tools()
+                    .iter()
+                    .map(|t| (t.tool.name.clone(), t.server_name.clone()))
+                    .collect()
+            })
+            .unwrap_or_default();
+
+        RunTools {
+            descriptions,
+            json,
+            names_key,
+            mcp_servers,
+        }
+    }
+
+    /// Format the research prompts for a run (see `ResearchPrompts`), dated
+    /// `now` so every topic is researched against the same "today".
+    fn research_prompts(
+        &self,
+        tools: &RunTools,
+        now: chrono::DateTime<chrono::Local>,
+    ) -> ResearchPrompts {
+        // Get current date components for research context
+        let current_date = now.format("%B %d, %Y").to_string();
+        let current_year = now.format("%Y").to_string();
+        let prev_year = (now.year() - 1).to_string();
+        let month_year = now.format("%B %Y").to_string();
+
+        // Build mode-specific tool usage instructions
+        let tool_usage_instructions = if self.research_mode == "firecrawl" {
+            format!(
+                r#"CRITICAL SEARCH TOOL USAGE (Firecrawl Deep Research Mode):
+- Use firecrawl_search to find {} articles - it searches AND extracts content in one call
+- Use specific search queries like "[topic] {}" or "[topic] {} latest news"
+- firecrawl_search returns full page content, not just URLs - analyze the results directly
+- Use firecrawl_scrape to get full content from specific URLs you want to analyze deeply
+- Use firecrawl_extract for structured data extraction with custom prompts (great for extracting specific facts)
+- Use firecrawl_map to discover related pages on a website
+- Use get_github_activity for open source projects to see recent commits, PRs, and releases from {}
+
+Firecrawl tools handle JavaScript-heavy sites and provide clean markdown content. Use them aggressively for comprehensive research."#,
+                month_year,
+                month_year,
+                current_year,
+                month_year
+            )
+        } else {
+            format!(
+                r#"CRITICAL SEARCH TOOL USAGE:
+- If you have access to brave_search or perplexity search tools, USE THEM FIRST to find {} articles and information
+- Use specific search queries like "[topic] {}" or "[topic] {} latest news"
+- Search tools will give you current URLs and content - these are your primary source for {} information
+- After getting search results, use fetch_webpage to read the most promising URLs in full
+- Use get_github_activity for open source projects to see recent commits, PRs, and releases from {}
+
+When using fetch_webpage directly (without search):
+- Target URLs likely to have {} content: TechCrunch, The Verge, Hacker News, company blogs, official documentation
+- Prioritize URLs with "/{}" or "{}" in the path"#,
+                month_year,
+                month_year,
+                current_year,
+                month_year,
+                month_year,
+                month_year,
+                current_year.to_lowercase(),
+                month_year.to_lowercase().replace(" ", "-")
+            )
+        };
+
+        // Build dynamic system prompt based on the run's tools
+        let system_prompt = format!(
+            r#"You are a research assistant gathering information on topics of interest.
+
+IMPORTANT: Today's date is {}. You must focus on finding information from {} and late {}. Any information from {} or earlier is outdated and should be avoided unless it provides essential background context.
+
+You have access to the following tools to fetch real-time data:
+{}
+
+{}
+
+After gathering current information, provide a comprehensive research summary based on {} data."#,
+            current_date,
+            month_year,
+            current_year,
+            prev_year,
+            tools.descriptions,
+            tool_usage_instructions,
+            month_year
+        );
+
+        let user_head = format!(
+            r#"Research the following topic and provide:
+1. Key recent developments from {} (ideally within the last 24-48 hours, or at minimum from late {})
+2. Why this might be relevant to someone interested in this topic
+3. Actionable insights or next steps
+4. Credible sources with dates (MUST be from {}, preferably {})
+
+"#,
+            month_year, current_year, current_year, month_year
+        );
+        let user_tail = format!(
+            r#"
+
+CRITICAL: Use the available tools aggressively to fetch current {} information. Do NOT rely solely on your training data, as it may be outdated. If you can't find {} information after trying multiple sources, explicitly state this limitation.
+
+Provide a concise but informative research summary (2-3 paragraphs) based on current {} data."#,
+            month_year, month_year, month_year
+        );
+
+        ResearchPrompts {
+            system: cached_system_prompt(system_prompt),
+            user_head,
+            user_tail,
+            date: now.format("%Y-%m-%d").to_string(),
+        }
     }
 
     /// Check if a tool is a built-in tool.
@@ -875,39 +1470,29 @@ impl ResearchAgent {
         past_cards_context: Option<String>,
     ) -> Result<ResearchResult, String> {
         let start_time = Instant::now();
+        // Wall-clock time for the briefing's date and title; elapsed time is
+        // measured with the monotonic `start_time`.
+        let started_at = chrono::Local::now();
         info!("Starting research on {} topics", topics.len());
 
         if topics.is_empty() {
             return Err("No topics provided for research".to_string());
         }
 
+        // Tool results are only reused within a run
+        self.tool_cache
+            .get_mut()
+            .unwrap_or_else(|e| e.into_inner())
+            .clear();
+
         // Emit research:started event and update phase
         research_state::set_phase("Starting research...");
 
-        // Debug logging to file
-        let log_path = dirs::home_dir()
-            .unwrap()
-            .join(".claudius")
-            .join("research-debug.log");
-        let _ = std::fs::write(
-            &log_path,
-            format!("{}: RESEARCH STARTED\n", chrono::Local::now()),
-        );
+        // Debug logging to file (written off the async runtime, see debug_log)
+        reset_debug_log("RESEARCH STARTED");
 
         if let Some(app) = &app_handle {
-            let _ = std::fs::OpenOptions::new()
-                .append(true)
-                .open(&log_path)
-                .and_then(|mut f| {
-                    std::io::Write::write_all(
-                        &mut f,
-                        format!(
-                            "{}: Emitting research:started event\n",
-                            chrono::Local::now()
-                        )
-                        .as_bytes(),
-                    )
-                });
+            debug_log("Emitting research:started event");
             let _ = app.emit(
                 "research:started",
                 ResearchStartedEvent {
@@ -922,34 +1507,13 @@ impl ResearchAgent {
         // The MCP client uses blocking I/O (std::io::BufReader::read_line) which would block
         // the entire async runtime if run directly. Using std::thread::spawn ensures the blocking
         // I/O runs on a completely separate OS thread.
-        let _ = std::fs::OpenOptions::new()
-            .append(true)
-            .open(&log_path)
-            .and_then(|mut f| {
-                std::io::Write::write_all(
-                    &mut f,
-                    format!(
-                        "{}: STARTING MCP INIT (std::thread)\n",
-                        chrono::Local::now()
-                    )
-                    .as_bytes(),
-                )
-            });
+        debug_log("STARTING MCP INIT (std::thread)");
 
         // Use a oneshot channel to get the result from the thread
         let (tx, rx) = tokio::sync::oneshot::channel();
-        let log_path_clone = log_path.clone();
 
         std::thread::spawn(move || {
-            let _ = std::fs::OpenOptions::new()
-                .append(true)
-                .open(&log_path_clone)
-                .and_then(|mut f| {
-                    std::io::Write::write_all(
-                        &mut f,
-                        format!("{}: MCP thread started\n", chrono::Local::now()).as_bytes(),
-                    )
-                });
+            debug_log("MCP thread started");
 
             // Create a new tokio runtime for this thread
             let rt = match tokio::runtime::Builder::new_current_thread()
@@ -964,105 +1528,35 @@ impl ResearchAgent {
             };
 
             let result = rt.block_on(async {
-                let _ = std::fs::OpenOptions::new()
-                    .append(true)
-                    .open(&log_path_clone)
-                    .and_then(|mut f| {
-                        std::io::Write::write_all(
-                            &mut f,
-                            format!("{}: Loading MCP servers config\n", chrono::Local::now())
-                                .as_bytes(),
-                        )
-                    });
+                debug_log("Loading MCP servers config");
 
                 match load_mcp_servers() {
                     Ok(servers) => {
                         let enabled_count = servers.iter().filter(|s| s.enabled).count();
-                        let _ = std::fs::OpenOptions::new()
-                            .append(true)
-                            .open(&log_path_clone)
-                            .and_then(|mut f| {
-                                std::io::Write::write_all(
-                                    &mut f,
-                                    format!(
-                                        "{}: Found {} enabled MCP servers\n",
-                                        chrono::Local::now(),
-                                        enabled_count
-                                    )
-                                    .as_bytes(),
-                                )
-                            });
+                        debug_log(format!("Found {} enabled MCP servers", enabled_count));
 
                         if enabled_count == 0 {
                             return Ok(None);
                         }
 
-                        let _ = std::fs::OpenOptions::new()
-                            .append(true)
-                            .open(&log_path_clone)
-                            .and_then(|mut f| {
-                                std::io::Write::write_all(
-                                    &mut f,
-                                    format!(
-                                        "{}: Connecting to MCP servers...\n",
-                                        chrono::Local::now()
-                                    )
-                                    .as_bytes(),
-                                )
-                            });
+                        debug_log("Connecting to MCP servers...");
 
                         match McpClient::connect(servers).await {
                             Ok(client) => {
-                                let _ = std::fs::OpenOptions::new()
-                                    .append(true)
-                                    .open(&log_path_clone)
-                                    .and_then(|mut f| {
-                                        std::io::Write::write_all(
-                                            &mut f,
-                                            format!(
-                                                "{}: MCP connect returned {} tools\n",
-                                                chrono::Local::now(),
-                                                client.tool_count()
-                                            )
-                                            .as_bytes(),
-                                        )
-                                    });
+                                debug_log(format!(
+                                    "MCP connect returned {} tools",
+                                    client.tool_count()
+                                ));
                                 Ok(Some(client))
                             }
                             Err(e) => {
-                                let _ = std::fs::OpenOptions::new()
-                                    .append(true)
-                                    .open(&log_path_clone)
-                                    .and_then(|mut f| {
-                                        std::io::Write::write_all(
-                                            &mut f,
-                                            format!(
-                                                "{}: MCP connect error: {}\n",
-                                                chrono::Local::now(),
-                                                e
-                                            )
-                                            .as_bytes(),
-                                        )
-                                    });
+                                debug_log(format!("MCP connect error: {}", e));
                                 Err(e)
                             }
                         }
                     }
                     Err(e) => {
-                        let _ = std::fs::OpenOptions::new()
-                            .append(true)
-                            .open(&log_path_clone)
-                            .and_then(|mut f| {
-                                std::io::Write::write_all(
-                                    &mut f,
-                                    format!(
-                                        "{}: Failed to load MCP config: {}\n",
-                                        chrono::Local::now(),
-                                        e
-                                    )
-                                    .as_bytes(),
-                                )
-                            });
+                        debug_log(format!("Failed to load MCP config: {}", e));
                         Err(e)
                     }
                 }
@@ -1085,65 +1579,27 @@ impl ResearchAgent {
                     client.server_count(),
                     client.tool_count()
                 );
-                let _ = std::fs::OpenOptions::new()
-                    .append(true)
-                    .open(&log_path)
-                    .and_then(|mut f| {
-                        std::io::Write::write_all(
-                            &mut f,
-                            format!(
-                                "{}: MCP INIT SUCCESS - {} tools\n",
-                                chrono::Local::now(),
-                                client.tool_count()
-                            )
-                            .as_bytes(),
-                        )
-                    });
-                self.mcp_client = Some(client);
+                debug_log(format!("MCP INIT SUCCESS - {} tools", client.tool_count()));
+                self.mcp_client = Some(Arc::new(client));
             }
             Ok(None) => {
                 info!("No MCP servers enabled");
-                let _ = std::fs::OpenOptions::new()
-                    .append(true)
-                    .open(&log_path)
-                    .and_then(|mut f| {
-                        std::io::Write::write_all(
-                            &mut f,
-                            format!("{}: NO MCP SERVERS ENABLED\n", chrono::Local::now())
-                                .as_bytes(),
-                        )
-                    });
+                debug_log("NO MCP SERVERS ENABLED");
             }
             Err(e) => {
                 warn!("MCP initialization failed: {}", e);
-                let _ = std::fs::OpenOptions::new()
-                    .append(true)
-                    .open(&log_path)
-                    .and_then(|mut f| {
-                        std::io::Write::write_all(
-                            &mut f,
-                            format!("{}: MCP INIT FAILED: {}\n", chrono::Local::now(), e)
-                                .as_bytes(),
-                        )
-                    });
+                debug_log(format!("MCP INIT FAILED: {}", e));
             }
         }
 
-        let _ = std::fs::OpenOptions::new()
-            .append(true)
-            .open(&log_path)
-            .and_then(|mut f| {
-                std::io::Write::write_all(
-                    &mut f,
-                    format!("{}: MCP INIT COMPLETE\n", chrono::Local::now()).as_bytes(),
-                )
-            });
+        debug_log("MCP INIT COMPLETE");
+        let _mcp_shutdown = self.mcp_client.clone().map(McpShutdownGuard);
 
         // Validate Firecrawl mode - fail early if Firecrawl MCP is not configured
         if self.research_mode == "firecrawl" {
             let has_firecrawl = self
                 .mcp_client
-                .as_ref()
+                .as_deref()
                 .map(|client| {
                     client
                         .get_all_tools()
@@ -1161,87 +1617,79 @@ impl ResearchAgent {
             }
         }
 
-        // Step 1: Research each topic with tool support
+        // Step 1: Research topics with tool support, a few at a time.
+        // Topics are grouped `topics_per_request` to a conversation (one each by
+        // default). `buffered` yields results in group order, so the research
+        // content handed to synthesis is laid out the same as a sequential run.
         let mut research_content = String::new();
         let mut total_tokens: u32 = 0;
-        let mut topic_stats: Vec<(String, usize)> = Vec::new(); // Track (topic_name, cards_generated)
-
-        let mut topics_completed_count = 0;
-        for (i, topic) in topics.iter().enumerate() {
-            // Check for cancellation before each topic
-            self.check_cancellation_with_event(
-                app_handle.as_ref(),
-                "researching",
-                topics_completed_count,
+        let topics_completed = AtomicUsize::new(0);
+        let group_size = self.topics_per_request;
+        let tools = self.run_tools();
+        let prompts = self.research_prompts(&tools, started_at);
+
+        // Futures are built up front (rather than in a `map` closure) so the
+        // run_research future stays `Send` for callers that `tokio::spawn` it.
+        let mut topic_futures = Vec::with_capacity(topics.len().div_ceil(group_size));
+        for (g, group) in topics.chunks(group_size).enumerate() {
+            topic_futures.push(self.research_topics_with_progress(
+                group,
+                g * group_size,
                 topics.len(),
-            )?;
-
-            info!("Researching topic {}/{}: {}", i + 1, topics.len(), topic);
-
-            // Update phase and emit research:topic_started event
-            research_state::set_phase(&format!(
-                "Researching topic {}/{}: {}",
-                i + 1,
-                topics.len(),
-                topic
+                &tools,
+                &prompts,
+                app_handle.as_ref(),
+                &topics_completed,
             ));
-            if let Some(app) = &app_handle {
-                let _ = app.emit(
-                    "research:topic_started",
-                    TopicStartedEvent {
-                        timestamp: get_timestamp(),
-                        topic_name: topic.clone(),
-                        topic_index: i,
-                        total_topics: topics.len(),
-                    },
-                );
-            }
-
-            match self
-                .research_topic_with_tools(topic, app_handle.as_ref(), i)
-                .await
-            {
-                Ok((content, tokens)) => {
-                    research_content.push_str(&format!(
-                        "\n## Topic {}: {}\n{}\n",
-                        i + 1,
-                        topic,
-                        content
-                    ));
+        }
+        // Results are consumed as they complete: content and token usage are
+        // accumulated here rather than in a second pass over collected results.
+        let mut results = stream::iter(topic_futures)
+            .buffered(MAX_CONCURRENT_TOPICS)
+            .zip(stream::iter(topics.chunks(group_size).enumerate()));
+
+        while let Some((result, (g, group))) = results.next().await {
+            let sections = match result {
+                Ok((sections, tokens)) => {
                     total_tokens += tokens;
-                    topic_stats.push((topic.clone(), 0)); // Will be updated after synthesis
+                    sections
                 }
                 Err(e) => {
-                    error!("Error researching topic '{}': {}", topic, e);
-                    research_content.push_str(&format!(
+                    error!("Error researching topic(s) {:?}: {}", group, e);
+                    vec![None; group.len()]
+                }
+            };
+            for (j, (topic, section)) in group.iter().zip(sections).enumerate() {
+                // Write into the buffer directly instead of via a temporary String
+                let _ = match section {
+                    Some(content) => write!(
+                        research_content,
+                        "\n## Topic {}: {}\n{}\n",
+                        g * group_size + j + 1,
+                        topic,
+                        content
+                    ),
+                    None => write!(
+                        research_content,
                         "\n## Topic {}: {}\nError: Could not research this topic.\n",
-                        i + 1,
+                        g * group_size + j + 1,
                         topic
-                    ));
-                    topic_stats.push((topic.clone(), 0));
-                }
-            }
-
-            // Emit research:topic_completed event
-            if let Some(app) = &app_handle {
-                let _ = app.emit(
-                    "research:topic_completed",
-                    TopicCompletedEvent {
-                        timestamp: get_timestamp(),
-                        topic_name: topic.clone(),
-                        topic_index: i,
-                        cards_generated: 0, // Will be known after synthesis
-                    },
-                );
+                    ),
+                };
             }
-
-            topics_completed_count += 1;
         }
 
-        // Check for cancellation before synthesis
+        // Check for cancellation before synthesis (topics skipped or cut short by
+        // a cancel show up above as errors; this aborts the run)
+        let topics_completed_count = topics_completed.load(Ordering::Relaxed);
+        let phase = if topics_completed_count < topics.len() {
+            "researching"
+        } else {
+            "synthesizing"
+        };
         self.check_cancellation_with_event(
             app_handle.as_ref(),
-            "synthesizing",
+            phase,
             topics_completed_count,
             topics.len(),
         )?;
@@ -1268,11 +1716,8 @@ impl ResearchAgent {
         let research_time_ms = start_time.elapsed().as_millis() as u64;
 
         let result = ResearchResult {
-            date: chrono::Local::now().format("%Y-%m-%dT%H:%M:%S").to_string(),
-            title: format!(
-                "Daily Briefing - {}",
-                chrono::Local::now().format("%B %d, %Y")
-            ),
+            date: started_at.format("%Y-%m-%dT%H:%M:%S").to_string(),
+            title: format!("Daily Briefing - {}", started_at.format("%B %d, %Y")),
             cards,
             research_time_ms,
             model_used: self.model.clone(),
@@ -1298,113 +1743,123 @@ impl ResearchAgent {
         Ok(result)
     }
 
-    /// Research a single topic using Claude with tool support.
-    async fn research_topic_with_tools(
-        &mut self,
-        topic: &str,
+    /// Research a group of topics (usually just one) as part of a run: skip it
+    /// if the run was cancelled, and report progress (phase + topic
+    /// started/completed events) around it. Returns one section per topic;
+    /// `None` marks a topic missing from a grouped response.
+    async fn research_topics_with_progress(
+        &self,
+        topics: &[String],
+        first_index: usize,
+        total_topics: usize,
+        tools: &RunTools,
+        prompts: &ResearchPrompts,
         app_handle: Option<&tauri::AppHandle>,
-        topic_index: usize,
-    ) -> Result<(String, u32), String> {
-        // Build dynamic system prompt based on available tools
-        let tools = self.get_all_tools();
-        let tool_descriptions: Vec<String> = tools
-            .iter()
-            .map(|t| format!("- {}: {}", t.name, t.description))
-            .collect();
-
-        // Get current date components for research context
-        let now = chrono::Local::now();
-        let current_date = now.format("%B %d, %Y").to_string();
-        let _current_month = now.format("%B").to_string();
-        let current_year = now.format("%Y").to_string();
-        let prev_year = (now.year() - 1).to_string();
-        let month_year = now.format("%B %Y").to_string();
-
-        // Build mode-specific tool usage instructions
-        let tool_usage_instructions = if self.research_mode == "firecrawl" {
-            format!(
-                r#"CRITICAL SEARCH TOOL USAGE (Firecrawl Deep Research Mode):
-- Use firecrawl_search to find {} articles - it searches AND extracts content in one call
-- Use specific search queries like "[topic] {}" or "[topic] {} latest news"
-- firecrawl_search returns full page content, not just URLs - analyze the results directly
-- Use firecrawl_scrape to get full content from specific URLs you want to analyze deeply
-- Use firecrawl_extract for structured data extraction with custom prompts (great for extracting specific facts)
-- Use firecrawl_map to discover related pages on a website
-- Use get_github_activity for open source projects to see recent commits, PRs, and releases from {}
-
-Firecrawl tools handle JavaScript-heavy sites and provide clean markdown content. Use them aggressively for comprehensive research."#,
-                month_year,
-                month_year,
-                current_year,
-                month_year
-            )
+        topics_completed: &AtomicUsize,
+    ) -> Result<(Vec<Option<String>>, u32), String> {
+        // Check for cancellation before each topic
+        self.check_cancellation()?;
+
+        let label = topics.join(", ");
+        let position = if topics.len() == 1 {
+            format!("{}/{}", first_index + 1, total_topics)
         } else {
             format!(
-                r#"CRITICAL SEARCH TOOL USAGE:
-- If you have access to brave_search or perplexity search tools, USE THEM FIRST to find {} articles and information
-- Use specific search queries like "[topic] {}" or "[topic] {} latest news"
-- Search tools will give you current URLs and content - these are your primary source for {} information
-- After getting search results, use fetch_webpage to read the most promising URLs in full
-- Use get_github_activity for open source projects to see recent commits, PRs, and releases from {}
-
-When using fetch_webpage directly (without search):
-- Target URLs likely to have {} content: TechCrunch, The Verge, Hacker News, company blogs, official documentation
-- Prioritize URLs with "/{}" or "{}" in the path"#,
-                month_year,
-                month_year,
-                current_year,
-                month_year,
-                month_year,
-                month_year,
-                current_year.to_lowercase(),
-                month_year.to_lowercase().replace(" ", "-")
+                "{}-{}/{}",
+                first_index + 1,
+                first_index + topics.len(),
+                total_topics
             )
         };
+        info!("Researching topic {}: {}", position, label);
 
-        let system_prompt = format!(
-            r#"You are a research assistant gathering information on topics of interest.
-
-IMPORTANT: Today's date is {}. You must focus on finding information from {} and late {}. Any information from {} or earlier is outdated and should be avoided unless it provides essential background context.
-
-You have access to the following tools to fetch real-time data:
-{}
+        // Update phase and emit research:topic_started events
+        research_state::set_phase(&format!("Researching topic {}: {}", position, label));
+        if let Some(app) = app_handle {
+            for (j, topic) in topics.iter().enumerate() {
+                let _ = app.emit(
+                    "research:topic_started",
+                    TopicStartedEvent {
+                        timestamp: get_timestamp(),
+                        topic_name: topic.clone(),
+                        topic_index: first_index + j,
+                        total_topics,
+                    },
+                );
+            }
+        }
 
-{}
+        let cache_key = self.topic_cache_key(topics, tools, prompts);
+        let cached = if self.force_refresh {
+            None
+        } else {
+            read_topic_cache(&cache_key).await
+        };
+        let research = match cached {
+            Some(content) => {
+                info!("Using cached research for: {}", label);
+                Ok((content, 0))
+            }
+            None => {
+                let research = self
+                    .research_topic_with_tools(topics, tools, prompts, app_handle, first_index)
+                    .await;
+                if let Ok((content, _)) = &research {
+                    // A grouped response without delimiters can't be split
+                    // per topic; don't replay that fallback on later runs.
+                    let splittable = topics.len() == 1 || TOPIC_DELIMITER_RE.is_match(content);
+                    if splittable && !content.is_empty() && content != MAX_ITERATIONS_SUMMARY {
+                        write_topic_cache(&cache_key, content).await;
+                    }
+                }
+                research
+            }
+        };
 
-After gathering current information, provide a comprehensive research summary based on {} data."#,
-            current_date,
-            month_year,
-            current_year,
-            prev_year,
-            tool_descriptions.join("\n"),
-            tool_usage_instructions,
-            month_year
-        );
+        let result = research.map(|(content, tokens)| {
+            let sections = if topics.len() == 1 {
+                vec![Some(content)]
+            } else {
+                split_topic_sections(&content, topics.len())
+            };
+            (sections, tokens)
+        });
 
-        let user_prompt = format!(
-            r#"Research the following topic and provide:
-1. Key recent developments from {} (ideally within the last 24-48 hours, or at minimum from late {})
-2. Why this might be relevant to someone interested in this topic
-3. Actionable insights or next steps
-4. Credible sources with dates (MUST be from {}, preferably {})
+        // Emit research:topic_completed events
+        if let Some(app) = app_handle {
+            for (j, topic) in topics.iter().enumerate() {
+                let _ = app.emit(
+                    "research:topic_completed",
+                    TopicCompletedEvent {
+                        timestamp: get_timestamp(),
+                        topic_name: topic.clone(),
+                        topic_index: first_index + j,
+                        cards_generated: 0, // Will be known after synthesis
+                    },
+                );
+            }
+        }
+        topics_completed.fetch_add(topics.len(), Ordering::Relaxed);
 
-Topic: {}
+        result
+    }
 
-CRITICAL: Use the available tools aggressively to fetch current {} information. Do NOT rely solely on your training data, as it may be outdated. If you can't find {} information after trying multiple sources, explicitly state this limitation.
+    /// Research topics using Claude with tool support. Several topics share one
+    /// conversation and come back as `<<<TOPIC k>>>`-delimited sections.
+    async fn research_topic_with_tools(
+        &self,
+        topics: &[String],
+        tools: &RunTools,
+        prompts: &ResearchPrompts,
+        app_handle: Option<&tauri::AppHandle>,
+        topic_index: usize,
+    ) -> Result<(String, u32), String> {
+        let label = topics.join(", ");
+        let topic = label.as_str();
 
-Provide a concise but informative research summary (2-3 paragraphs) based on current {} data."#,
-            month_year,
-            current_year,
-            current_year,
-            month_year,
-            topic,
-            month_year,
-            month_year,
-            month_year
-        );
         let mut messages = vec![Message {
             role: "user".to_string(),
-            content: MessageContent::Text(user_prompt),
+            content: MessageContent::Text(prompts.user_prompt(topics)),
         }];
 
         let mut total_tokens: u32 = 0;
@@ -1446,11 +1901,13 @@ Provide a concise but informative research summary (2-3 paragraphs) based on cur
             }
 
             let request = AnthropicRequest {
-                model: self.model.clone(),
-                max_tokens: 2048,
-                messages: messages.clone(),
-                tools: Some(self.get_tools_json()),
-                system: Some(system_prompt.to_string()),
+                model: &self.model,
+                // Each grouped topic needs room for its own summary
+                max_tokens: (2048 * topics.len() as u32).min(8192),
+                messages: &messages,
+                tools: Some(&tools.json),
+                system: Some(&prompts.system),
+                stream: false,
             };
 
             info!(
@@ -1467,12 +1924,12 @@ Provide a concise but informative research summary (2-3 paragraphs) based on cur
                 }
             };
             let api_duration = api_start.elapsed().as_millis() as i64;
-            let tokens = response.usage.input_tokens + response.usage.output_tokens;
+            let tokens = response.usage.total();
             total_tokens += tokens;
 
             info!(
-                "Claude API responded in {}ms ({} tokens, stop_reason: {:?})",
-                api_duration, tokens, response.stop_reason
+                "Claude API responded in {}ms ({} tokens, {} from cache, stop_reason: {:?})",
+                api_duration, tokens, response.usage.cache_read_input_tokens, response.stop_reason
             );
 
             // Log successful API request
@@ -1560,20 +2017,7 @@ Provide a concise but informative research summary (2-3 paragraphs) based on cur
                     topic
                 );
                 // No more tool calls, extract the text response
-                let text_content: String = response
-                    .content
-                    .iter()
-                    .filter_map(|c| {
-                        if c.content_type == "text" {
-                            c.text.clone()
-                        } else {
-                            None
-                        }
-                    })
-                    .collect::<Vec<_>>()
-                    .join("\n");
-
-                return Ok((text_content, total_tokens));
+                return Ok((response.text(), total_tokens));
             }
 
             // Build assistant message with tool uses
@@ -1583,13 +2027,13 @@ Provide a concise but informative research summary (2-3 paragraphs) based on cur
                 .iter()
                 .filter_map(|c| {
                     if c.content_type == "text" {
-                        let text = c.text.clone().unwrap_or_default();
                         // Only include non-empty text blocks
-                        if !text.is_empty() {
-                            Some(ContentBlock::Text { text })
-                        } else {
-                            None
-                        }
+                        c.text
+                            .as_deref()
+                            .filter(|text| !text.is_empty())
+                            .map(|text| ContentBlock::Text {
+                                text: text.to_string(),
+                            })
                     } else if c.content_type == "tool_use" {
                         Some(ContentBlock::ToolUse {
                             id: c.id.clone().unwrap_or_default(),
@@ -1610,262 +2054,547 @@ Provide a concise but informative research summary (2-3 paragraphs) based on cur
 
             // Execute tools and build results
             info!("Claude requested {} tool call(s)", tool_uses.len());
-            let mut tool_results: Vec<ContentBlock> = Vec::new();
-            let empty_input = json!({});
+            // Independent calls run concurrently; join_all keeps results in
+            // request order so each tool_result lines up with its tool_use.
+            let mut tool_futures = Vec::with_capacity(tool_uses.len());
             for tool_use in tool_uses {
-                let tool_name = tool_use.name.as_deref().unwrap_or("");
-                let tool_id = tool_use.id.as_deref().unwrap_or("");
-                let tool_input = tool_use.input.as_ref().unwrap_or(&empty_input);
-                let input_str = serde_json::to_string(tool_input).unwrap_or_default();
-
-                info!("Executing tool: {}", tool_name);
-                debug!("Tool input: {}", tool_input);
-
-                let tool_start = Instant::now();
-
-                // Route to built-in tools or MCP client
-                let is_mcp_tool = !self.is_builtin_tool(tool_name);
-                let mcp_server_name: Option<String> = if is_mcp_tool {
-                    // Find which server this tool belongs to
-                    self.mcp_client.as_ref().and_then(|client| {
-                        client
-                            .get_all_tools()
-                            .into_iter()
-                            .find(|t| t.tool.name == tool_name)
-                            .map(|t| t.server_name)
-                    })
-                } else {
-                    None
-                };
+                tool_futures.push(self.execute_tool_use(topic, tools, tool_use));
+            }
+            let tool_results: Vec<ContentBlock> = future::join_all(tool_futures).await;
 
-                // Rate-limit expensive tools (firecrawl_agent: 5 free/day, then 200-600 credits)
-                const FIRECRAWL_AGENT_DAILY_LIMIT: i64 = 5;
-                let is_firecrawl_agent = tool_name.contains("firecrawl_agent");
-                let rate_limited = if is_firecrawl_agent && self.rate_limit_firecrawl_agent {
-                    // Check how many firecrawl_agent calls we've made today
-                    // Use SQLite date range for reliable comparison across timezones
-                    let daily_count = match crate::db::get_connection() {
-                        Ok(conn) => {
-                            match conn.query_row(
-                                "SELECT COUNT(*) FROM research_logs
-                                 WHERE tool_name LIKE '%firecrawl_agent%'
-                                 AND created_at >= DATE('now', 'localtime', 'start of day')
-                                 AND created_at < DATE('now', 'localtime', 'start of day', '+1 day')",
-                                [],
-                                |row| row.get::<_, i64>(0),
-                            ) {
-                                Ok(count) => count,
-                                Err(e) => {
-                                    error!("Failed to query firecrawl_agent usage: {}", e);
-                                    // Fail closed: assume limit exceeded to prevent unexpected charges
-                                    FIRECRAWL_AGENT_DAILY_LIMIT + 1
-                                }
-                            }
-                        }
+            // Add tool results as user message
+            messages.push(Message {
+                role: "user".to_string(),
+                content: MessageContent::Blocks(tool_results),
+            });
+        }
+
+        // If we exit the loop due to max iterations, extract any text we have
+        Ok((MAX_ITERATIONS_SUMMARY.to_string(), total_tokens))
+    }
+
+    /// Execute one tool call requested by Claude (built-in or MCP), logging it,
+    /// and build the matching tool_result block. Failures become error results.
+    async fn execute_tool_use(
+        &self,
+        topic: &str,
+        tools: &RunTools,
+        tool_use: &ResponseContentBlock,
+    ) -> ContentBlock {
+        let tool_name = tool_use.name.as_deref().unwrap_or("");
+        let tool_id = tool_use.id.as_deref().unwrap_or("");
+        let empty_input = json!({});
+        let tool_input = tool_use.input.as_ref().unwrap_or(&empty_input);
+        let input_str = serde_json::to_string(tool_input).unwrap_or_default();
+
+        // serde_json sorts object keys, so equal inputs give equal keys.
+        let cache_key = format!("{}:{}", tool_name, input_str);
+        if let Some(output) = self.cached_tool_result(&cache_key) {
+            info!(
+                "Tool {} served from run cache (output: {} chars)",
+                tool_name,
+                output.len()
+            );
+            return ContentBlock::ToolResult {
+                tool_use_id: tool_id.to_string(),
+                content: output,
+                is_error: None,
+            };
+        }
+
+        info!("Executing tool: {}", tool_name);
+        debug!("Tool input: {}", tool_input);
+
+        let tool_start = Instant::now();
+
+        // Route to built-in tools or MCP client
+        let is_mcp_tool = !self.is_builtin_tool(tool_name);
+        let mcp_server_name: Option<String> = if is_mcp_tool {
+            // Find which server this tool belongs to
+            tools.mcp_servers.get(tool_name).cloned()
+        } else {
+            None
+        };
+
+        // Rate-limit expensive tools (firecrawl_agent: 5 free/day, then 200-600 credits)
+        const FIRECRAWL_AGENT_DAILY_LIMIT: i64 = 5;
+        let is_firecrawl_agent = classify_tool(tool_name) == ToolClass::Expensive;
+        let rate_limited = if is_firecrawl_agent && self.rate_limit_firecrawl_agent {
+            // Check how many firecrawl_agent calls we've made today
+            // Use SQLite date range for reliable comparison across timezones
+            let daily_count = match crate::db::get_connection() {
+                Ok(conn) => {
+                    match conn.query_row(
+                        "SELECT COUNT(*) FROM research_logs
+                         WHERE tool_name LIKE '%firecrawl_agent%'
+                         AND created_at >= DATE('now', 'localtime', 'start of day')
+                         AND created_at < DATE('now', 'localtime', 'start of day', '+1 day')",
+                        [],
+                        |row| row.get::<_, i64>(0),
+                    ) {
+                        Ok(count) => count,
                         Err(e) => {
-                            error!("Database connection failed during rate limit check: {}", e);
+                            error!("Failed to query firecrawl_agent usage: {}", e);
                             // Fail closed: assume limit exceeded to prevent unexpected charges
                             FIRECRAWL_AGENT_DAILY_LIMIT + 1
                         }
-                    };
+                    }
+                }
+                Err(e) => {
+                    error!("Database connection failed during rate limit check: {}", e);
+                    // Fail closed: assume limit exceeded to prevent unexpected charges
+                    FIRECRAWL_AGENT_DAILY_LIMIT + 1
+                }
+            };
 
-                    if daily_count >= FIRECRAWL_AGENT_DAILY_LIMIT {
-                        warn!(
-                            "firecrawl_agent rate limited: {} calls today (limit: {})",
-                            daily_count, FIRECRAWL_AGENT_DAILY_LIMIT
-                        );
-                        true
-                    } else {
-                        info!(
-                            "firecrawl_agent allowed: {} of {} daily calls used",
-                            daily_count, FIRECRAWL_AGENT_DAILY_LIMIT
+            if daily_count >= FIRECRAWL_AGENT_DAILY_LIMIT {
+                warn!(
+                    "firecrawl_agent rate limited: {} calls today (limit: {})",
+                    daily_count, FIRECRAWL_AGENT_DAILY_LIMIT
+                );
+                true
+            } else {
+                info!(
+                    "firecrawl_agent allowed: {} of {} daily calls used",
+                    daily_count, FIRECRAWL_AGENT_DAILY_LIMIT
+                );
+                false
+            }
+        } else {
+            false
+        };
+
+        let result = if rate_limited {
+            // Return error for rate-limited tools
+            Err(format!(
+                "Tool '{}' has reached its daily limit ({} calls). Please use firecrawl_search, firecrawl_scrape, or firecrawl_extract instead.",
+                tool_name, FIRECRAWL_AGENT_DAILY_LIMIT
+            ))
+        } else if self.is_builtin_tool(tool_name) {
+            // Execute built-in tool
+            execute_tool(
+                &self.client,
+                tool_name,
+                tool_input,
+                self.github_token.as_deref(),
+            )
+            .await
+        } else if let Some(mcp_client) = self.mcp_client.clone() {
+            // Execute MCP tool
+            // For Firecrawl tools, inject onlyMainContent: true to reduce token usage
+            let tool_args = if FIRECRAWL_CONTENT_TOOL_RE.is_match(tool_name) {
+                let mut args = tool_input.clone();
+                if let Some(obj) = args.as_object_mut() {
+                    // Only set if not already specified
+                    if !obj.contains_key("onlyMainContent") {
+                        obj.insert("onlyMainContent".to_string(), json!(true));
+                        debug!(
+                            "Injected onlyMainContent=true for Firecrawl tool: {}",
+                            tool_name
                         );
-                        false
                     }
+                }
+                args
+            } else {
+                tool_input.clone()
+            };
+            // MCP stdio I/O is blocking; keep it off the async workers so
+            // other topics' API calls keep progressing meanwhile.
+            let name = tool_name.to_string();
+            tokio::task::spawn_blocking(move || mcp_client.call_tool(&name, tool_args))
+                .await
+                .map_err(|e| format!("MCP tool task failed: {}", e))
+                .and_then(|r| r)
+                .map(tool_result_text)
+        } else {
+            Err(format!("Unknown tool: {}", tool_name))
+        };
+
+        let tool_duration = tool_start.elapsed().as_millis() as i64;
+
+        let (content, is_error) = match result {
+            Ok(output) => {
+                info!(
+                    "Tool {} completed in {}ms (output: {} chars)",
+                    tool_name,
+                    tool_duration,
+                    output.len()
+                );
+                self.cache_tool_result(cache_key, &output);
+                // Log successful tool call - use MCP logging if it's an MCP tool
+                if is_mcp_tool {
+                    let server_name = mcp_server_name.as_deref().unwrap_or("unknown");
+                    let _ = ResearchLogger::log_mcp_call(
+                        topic,
+                        server_name,
+                        tool_name,
+                        &input_str,
+                        &output,
+                        tool_duration,
+                    );
                 } else {
-                    false
+                    let _ = ResearchLogger::log_tool_call(
+                        topic,
+                        tool_name,
+                        &input_str,
+                        &output,
+                        tool_duration,
+                    );
+                }
+                (output, None)
+            }
+            Err(e) => {
+                error!("Tool {} failed: {}", tool_name, e);
+                // Log failed tool call - use appropriate error code for MCP tools
+                let err = if is_mcp_tool {
+                    ResearchError::new(ErrorCode::McpToolFailed, &e)
+                } else {
+                    ResearchError::new(ErrorCode::ToolExecutionFailed, &e)
                 };
 
-                let result = if rate_limited {
-                    // Return error for rate-limited tools
-                    Err(format!(
-                        "Tool '{}' has reached its daily limit ({} calls). Please use firecrawl_search, firecrawl_scrape, or firecrawl_extract instead.",
-                        tool_name, FIRECRAWL_AGENT_DAILY_LIMIT
-                    ))
-                } else if self.is_builtin_tool(tool_name) {
-                    // Execute built-in tool
-                    execute_tool(
-                        &self.client,
+                if is_mcp_tool {
+                    let server_name = mcp_server_name.as_deref().unwrap_or("unknown");
+                    let _ = ResearchLogger::log_mcp_error(topic, server_name, &err);
+                } else {
+                    let _ = ResearchLogger::log_tool_error(
+                        topic,
                         tool_name,
-                        tool_input,
-                        self.github_token.as_deref(),
+                        &input_str,
+                        &err,
+                        tool_duration,
+                    );
+                }
+                (format!("Error: {}", e), Some(true))
+            }
+        };
+
+        ContentBlock::ToolResult {
+            tool_use_id: tool_id.to_string(),
+            content,
+            is_error,
+        }
+    }
+
+    /// Send a request to the Anthropic API.
+    async fn send_request(
+        &self,
+        request: &AnthropicRequest<'_>,
+    ) -> Result<AnthropicResponse, ResearchError> {
+        self.with_api_retry("Claude API request", || async {
+            let response = self
+                .api_request(
+                    reqwest::Method::POST,
+                    "https://api.anthropic.com/v1/messages",
+                )
+                .json(request)
+                .send()
+                .await;
+
+            check_api_response(response)
+                .await?
+                .json()
+                .await
+                .map_err(|e| {
+                    ResearchError::new(
+                        ErrorCode::ParseError,
+                        format!("Failed to parse response: {}", e),
                     )
-                    .await
-                } else if let Some(ref mut mcp_client) = self.mcp_client {
-                    // Execute MCP tool
-                    // For Firecrawl tools, inject onlyMainContent: true to reduce token usage
-                    let firecrawl_content_tools = [
-                        "firecrawl_scrape",
-                        "firecrawl_search",
-                        "firecrawl_extract",
-                        "firecrawl_crawl",
-                    ];
-                    let tool_args = if firecrawl_content_tools
-                        .iter()
-                        .any(|t| tool_name.contains(t))
-                    {
-                        let mut args = tool_input.clone();
-                        if let Some(obj) = args.as_object_mut() {
-                            // Only set if not already specified
-                            if !obj.contains_key("onlyMainContent") {
-                                obj.insert("onlyMainContent".to_string(), json!(true));
-                                debug!(
-                                    "Injected onlyMainContent=true for Firecrawl tool: {}",
-                                    tool_name
-                                );
-                            }
-                        }
-                        args
-                    } else {
-                        tool_input.clone()
-                    };
-                    mcp_client
-                        .call_tool(tool_name, tool_args)
-                        .map(|v| {
-                            if let Some(s) = v.as_str() {
-                                s.to_string()
-                            } else {
-                                serde_json::to_string_pretty(&v).unwrap_or_default()
-                            }
-                        })
-                } else {
-                    Err(format!("Unknown tool: {}", tool_name))
-                };
+                })
+        })
+        .await
+        .inspect(|response: &AnthropicResponse| {
+            self.rate_limiter.record_tokens(response.usage.total())
+        })
+    }
+
+    /// Run an API call, retrying transient failures with backoff. Permanent
+    /// errors (bad key, budget, invalid request) are returned immediately, and
+    /// retries stop if the run is cancelled.
+    async fn with_api_retry<T, F, Fut>(&self, what: &str, mut call: F) -> Result<T, ResearchError>
+    where
+        F: FnMut() -> Fut,
+        Fut: std::future::Future<Output = Result<T, ResearchError>>,
+    {
+        let mut attempt = 1;
+        loop {
+            // Every attempt, retries included, counts against the budget
+            self.rate_limiter.acquire().await;
+            match call().await {
+                Err(e)
+                    if e.code.is_transient()
+                        && attempt < API_MAX_ATTEMPTS
+                        && self.check_cancellation().is_ok() =>
+                {
+                    let delay = retry_delay(attempt, e.retry_after_secs);
+                    warn!(
+                        "{} failed (attempt {}/{}): {}. Retrying in {:.1}s",
+                        what,
+                        attempt,
+                        API_MAX_ATTEMPTS,
+                        e.message,
+                        delay.as_secs_f64()
+                    );
+                    self.sleep_unless_cancelled(delay).await?;
+                    attempt += 1;
+                }
+                result => return result,
+            }
+        }
+    }
 
-                let tool_duration = tool_start.elapsed().as_millis() as i64;
+    /// Sleep for `delay`, waking early with an error if the run is cancelled.
+    async fn sleep_unless_cancelled(&self, delay: Duration) -> Result<(), ResearchError> {
+        let deadline = tokio::time::Instant::now() + delay;
+        loop {
+            if let Err(e) = self.check_cancellation() {
+                return Err(ResearchError::new(ErrorCode::InternalError, e));
+            }
+            let now = tokio::time::Instant::now();
+            if now >= deadline {
+                return Ok(());
+            }
+            tokio::time::sleep((deadline - now).min(CANCEL_CHECK_INTERVAL)).await;
+        }
+    }
 
-                let (content, is_error) = match result {
-                    Ok(output) => {
-                        info!(
-                            "Tool {} completed in {}ms (output: {} chars)",
-                            tool_name,
-                            tool_duration,
-                            output.len()
-                        );
-                        // Log successful tool call - use MCP logging if it's an MCP tool
-                        if is_mcp_tool {
-                            let server_name = mcp_server_name.as_deref().unwrap_or("unknown");
-                            let _ = ResearchLogger::log_mcp_call(
-                                topic,
-                                server_name,
-                                tool_name,
-                                &input_str,
-                                &output,
-                                tool_duration,
-                            );
-                        } else {
-                            let _ = ResearchLogger::log_tool_call(
-                                topic,
-                                tool_name,
-                                &input_str,
-                                &output,
-                                tool_duration,
-                            );
+    /// Send a streaming request to the Anthropic API and assemble the full
+    /// response. Each attempt gets a fresh text handler from `on_attempt`, which
+    /// is handed the text deltas as they arrive; a transient failure mid-stream
+    /// retries the whole request, starting over with a new handler.
+    async fn send_streaming_request<F: FnMut(&str)>(
+        &self,
+        request: &AnthropicRequest<'_>,
+        on_attempt: impl Fn() -> F,
+    ) -> Result<AnthropicResponse, ResearchError> {
+        self.with_api_retry("Claude API stream", || {
+            self.stream_response(request, on_attempt())
+        })
+        .await
+    }
+
+    /// One attempt of `send_streaming_request`: open the stream and read it to
+    /// the end.
+    async fn stream_response(
+        &self,
+        request: &AnthropicRequest<'_>,
+        mut on_text: impl FnMut(&str),
+    ) -> Result<AnthropicResponse, ResearchError> {
+        let response = self
+            .api_request(
+                reqwest::Method::POST,
+                "https://api.anthropic.com/v1/messages",
+            )
+            .json(request)
+            .send()
+            .await;
+        let mut response = check_api_response(response).await?;
+
+        let mut decoder = SseDecoder::default();
+        let mut content: Vec<ResponseContentBlock> = Vec::new();
+        let mut usage: Option<Usage> = None;
+        let mut stop_reason = None;
+
+        loop {
+            let chunk = response.chunk().await.map_err(|e| {
+                ResearchError::new(
+                    ErrorCode::NetworkError,
+                    format!("Response stream failed: {}", e),
+                )
+            })?;
+            let Some(chunk) = chunk else {
+                break;
+            };
+
+            for data in decoder.push(&chunk) {
+                let event: StreamEvent = serde_json::from_str(&data).map_err(|e| {
+                    ResearchError::new(
+                        ErrorCode::ParseError,
+                        format!("Failed to parse stream event: {}", e),
+                    )
+                })?;
+                match event {
+                    StreamEvent::MessageStart { message } => usage = Some(message.usage),
+                    StreamEvent::ContentBlockStart {
+                        index,
+                        content_block,
+                    } => {
+                        if index >= content.len() {
+                            content.resize_with(index, || ResponseContentBlock {
+                                content_type: String::new(),
+                                text: None,
+                                id: None,
+                                name: None,
+                                input: None,
+                            });
+                            content.push(content_block);
                         }
-                        (output, None)
                     }
-                    Err(e) => {
-                        error!("Tool {} failed: {}", tool_name, e);
-                        // Log failed tool call - use appropriate error code for MCP tools
-                        let err = if is_mcp_tool {
-                            ResearchError::new(ErrorCode::McpToolFailed, &e)
-                        } else {
-                            ResearchError::new(ErrorCode::ToolExecutionFailed, &e)
-                        };
-
-                        if is_mcp_tool {
-                            let server_name = mcp_server_name.as_deref().unwrap_or("unknown");
-                            let _ = ResearchLogger::log_mcp_error(topic, server_name, &err);
-                        } else {
-                            let _ = ResearchLogger::log_tool_error(
-                                topic,
-                                tool_name,
-                                &input_str,
-                                &err,
-                                tool_duration,
-                            );
+                    StreamEvent::ContentBlockDelta {
+                        index,
+                        delta: StreamDelta::TextDelta { text },
+                    } => {
+                        on_text(&text);
+                        if let Some(block) = content.get_mut(index) {
+                            block.text.get_or_insert_with(String::new).push_str(&text);
                         }
-                        (format!("Error: {}", e), Some(true))
                     }
-                };
-
-                tool_results.push(ContentBlock::ToolResult {
-                    tool_use_id: tool_id.to_string(),
-                    content,
-                    is_error,
-                });
+                    StreamEvent::MessageDelta {
+                        delta,
+                        usage: delta_usage,
+                    } => {
+                        stop_reason = delta.stop_reason;
+                        if let Some(usage) = usage.as_mut() {
+                            usage.output_tokens = delta_usage.output_tokens;
+                        }
+                    }
+                    StreamEvent::Error { .. } => {
+                        // The event carries an API error body, so it classifies
+                        // (and retries) like an HTTP error response would.
+                        let err = parse_api_error(500, &data);
+                        error!("API stream error: {} (code: {:?})", err.message, err.code);
+                        return Err(err);
+                    }
+                    StreamEvent::ContentBlockDelta { .. } | StreamEvent::Other => {}
+                }
             }
-
-            // Add tool results as user message
-            messages.push(Message {
-                role: "user".to_string(),
-                content: MessageContent::Blocks(tool_results),
-            });
         }
 
-        // If we exit the loop due to max iterations, extract any text we have
-        Ok((
-            "Research completed (max iterations reached)".to_string(),
-            total_tokens,
-        ))
+        let usage = usage.ok_or_else(|| {
+            ResearchError::new(
+                ErrorCode::InvalidResponse,
+                "Response stream ended before message_start",
+            )
+        })?;
+        self.rate_limiter.record_tokens(usage.total());
+        Ok(AnthropicResponse {
+            content,
+            usage,
+            stop_reason,
+        })
     }
 
-    /// Send a request to the Anthropic API.
-    async fn send_request(
-        &self,
-        request: &AnthropicRequest,
-    ) -> Result<AnthropicResponse, ResearchError> {
-        let response = self
-            .client
-            .post("https://api.anthropic.com/v1/messages")
+    /// Start an authenticated Anthropic API request.
+    fn api_request(&self, method: reqwest::Method, url: &str) -> reqwest::RequestBuilder {
+        self.client
+            .request(method, url)
             .header("x-api-key", &self.api_key)
             .header("anthropic-version", "2023-06-01")
             .header("content-type", "application/json")
-            .json(request)
-            .send()
-            .await
-            .map_err(|e| {
-                let err = ResearchError::new(
-                    ErrorCode::NetworkError,
-                    format!("HTTP request failed: {}", e),
-                );
-                error!("Network error: {}", e);
-                err
-            })?;
+    }
 
-        if !response.status().is_success() {
-            let status = response.status().as_u16();
-            let body = response.text().await.unwrap_or_default();
-            let err = parse_api_error(status, &body);
+    /// Send a request through the Message Batches API and wait for its result.
+    ///
+    /// Polls the batch until it ends. If polling fails for good or the run is
+    /// cancelled meanwhile, the batch is cancelled too.
+    async fn send_batch_request(
+        &self,
+        request: &AnthropicRequest<'_>,
+        custom_id: &str,
+        app_handle: Option<&tauri::AppHandle>,
+    ) -> Result<AnthropicResponse, ResearchError> {
+        let body = BatchCreateRequest {
+            requests: vec![BatchRequestItem {
+                custom_id,
+                params: request,
+            }],
+        };
+        let batch = self
+            .with_api_retry("Message batch submission", || async {
+                let response = self
+                    .api_request(
+                        reqwest::Method::POST,
+                        "https://api.anthropic.com/v1/messages/batches",
+                    )
+                    .json(&body)
+                    .send()
+                    .await;
+                parse_batch_response(response).await
+            })
+            .await?;
+        info!("Submitted message batch {} ({})", batch.id, custom_id);
 
-            // Log the error
-            error!(
-                "API error {}: {} (code: {:?})",
-                status, err.message, err.code
-            );
-            if err.requires_user_action {
-                error!("USER ACTION REQUIRED: {}", err.user_message);
+        let batch_url = format!("https://api.anthropic.com/v1/messages/batches/{}", batch.id);
+        let batch = match self.wait_for_batch(batch, &batch_url, app_handle).await {
+            Ok(batch) => batch,
+            Err(e) => {
+                // Don't leave an abandoned batch running (and billed)
+                warn!("Cancelling message batch: {}", e.message);
+                let cancelled = self
+                    .api_request(reqwest::Method::POST, &format!("{}/cancel", batch_url))
+                    .send()
+                    .await;
+                if let Err(cancel_err) = check_api_response(cancelled).await {
+                    warn!("Failed to cancel message batch: {}", cancel_err.message);
+                }
+                return Err(e);
             }
+        };
 
-            return Err(err);
-        }
-
-        response.json().await.map_err(|e| {
+        let results_url = batch.results_url.ok_or_else(|| {
             ResearchError::new(
-                ErrorCode::ParseError,
-                format!("Failed to parse response: {}", e),
+                ErrorCode::InvalidResponse,
+                format!("Message batch {} ended without results", batch.id),
             )
-        })
+        })?;
+        let results = self
+            .with_api_retry("Message batch results", || async {
+                let response = self
+                    .api_request(reqwest::Method::GET, &results_url)
+                    .send()
+                    .await;
+                check_api_response(response)
+                    .await?
+                    .text()
+                    .await
+                    .map_err(|e| {
+                        ResearchError::new(
+                            ErrorCode::NetworkError,
+                            format!("Failed to read batch results: {}", e),
+                        )
+                    })
+            })
+            .await?;
+
+        find_batch_result(&results, custom_id)
+    }
+
+    /// Poll a submitted batch with exponential backoff until it has ended,
+    /// emitting heartbeats meanwhile. Fails if the run is cancelled.
+    async fn wait_for_batch(
+        &self,
+        mut batch: MessageBatch,
+        batch_url: &str,
+        app_handle: Option<&tauri::AppHandle>,
+    ) -> Result<MessageBatch, ResearchError> {
+        let mut delay = BATCH_POLL_INITIAL;
+        while batch.processing_status != "ended" {
+            self.sleep_unless_cancelled(delay).await?;
+            delay = (delay * 2).min(BATCH_POLL_MAX);
+
+            batch = self
+                .with_api_retry("Message batch status", || async {
+                    let response = self
+                        .api_request(reqwest::Method::GET, batch_url)
+                        .send()
+                        .await;
+                    parse_batch_response(response).await
+                })
+                .await?;
+            debug!("Message batch {} is {}", batch.id, batch.processing_status);
+
+            if let Some(app) = app_handle {
+                let _ = app.emit(
+                    "research:heartbeat",
+                    HeartbeatEvent {
+                        timestamp: get_timestamp(),
+                        phase: "synthesizing".to_string(),
+                        topic_index: None,
+                        message: format!("Waiting for batch {} to complete", batch.id),
+                    },
+                );
+            }
+        }
+        Ok(batch)
     }
 
     /// Synthesize research results into briefing cards.
@@ -1916,16 +2645,17 @@ When generating cards, avoid creating cards that duplicate these previously cove
             ""
         };
 
-        let prompt = if condense_briefings {
+        // The instructions only vary with research mode, so they go in a cached
+        // system prompt; the per-run dedup list and research go last, in the
+        // user message, so they don't break the cached prefix.
+        let system_prompt = if condense_briefings {
             // Condensed mode: one comprehensive card combining all topics
             format!(
                 r#"You are a research assistant creating a personalized daily briefing.
-Synthesize ALL the following research into ONE comprehensive briefing card that tells a cohesive story.
+Synthesize ALL the research in the user's message into ONE comprehensive briefing card that tells a cohesive story.
 {}
-CRITICAL: ONLY include information from the RESEARCH CONTENT below.
+CRITICAL: ONLY include information from the RESEARCH CONTENT in the user's message.
 Do NOT add topics from the deduplication list - that list is ONLY to help you avoid repeating old content.
-{}
-{}
 
 Create a SINGLE comprehensive briefing card following these guidelines:
 
@@ -1965,18 +2695,16 @@ Return ONLY valid JSON in this exact format:
       "image_prompt": "abstract network of connected glowing nodes"
     }}
   ]
-}}
-
-Return the JSON response now:"#,
-                depth_instruction, dedup_instruction, research_content, min_words_condensed, min_paragraphs_condensed
+}}"#,
+                depth_instruction, min_words_condensed, min_paragraphs_condensed
             )
         } else {
             // Standard mode: multiple cards
             format!(
                 r#"You are a research assistant creating a personalized daily briefing.
-Synthesize the following research results into clear, actionable briefing cards.
+Synthesize the research results in the user's message into clear, actionable briefing cards.
 {}
-CRITICAL: ONLY create cards for topics that appear in the RESEARCH CONTENT below. 
+CRITICAL: ONLY create cards for topics that appear in the RESEARCH CONTENT in the user's message.
 Do NOT create cards for topics mentioned in the deduplication list - that list is ONLY to help you avoid repeating old content.
 
 CARD QUALITY GUIDELINES:
@@ -1984,8 +2712,6 @@ CARD QUALITY GUIDELINES:
 - You MAY create multiple cards for a single topic IF there are genuinely distinct sub-themes or developments worth separating
 - Each card must be substantial and stand on its own - no filler cards
 - If in doubt, consolidate into fewer comprehensive cards rather than splitting thin content
-{}
-{}
 
 Generate briefing cards following these guidelines:
 
@@ -2027,22 +2753,28 @@ Return ONLY valid JSON in this exact format:
       "image_prompt": "futuristic circuit board with glowing pathways"
     }}
   ]
-}}
-
-Return the JSON response now:"#,
-                depth_instruction, dedup_instruction, research_content, min_words_standard, min_paragraphs_standard
+}}"#,
+                depth_instruction, min_words_standard, min_paragraphs_standard
             )
         };
 
+        let prompt = format!(
+            "{}\nRESEARCH CONTENT:\n{}\n\nReturn the JSON response now:",
+            dedup_instruction, research_content
+        );
+
+        let messages = [Message {
+            role: "user".to_string(),
+            content: MessageContent::Text(prompt),
+        }];
+        let system = cached_system_prompt(system_prompt);
         let request = AnthropicRequest {
-            model: self.model.clone(),
+            model: &self.model,
             max_tokens: 16384, // Large enough for many cards with detailed_content + image fields
-            messages: vec![Message {
-                role: "user".to_string(),
-                content: MessageContent::Text(prompt),
-            }],
+            messages: &messages,
             tools: None,
-            system: None,
+            system: Some(&system),
+            stream: !self.use_batch_api, // Batch requests can't stream
         };
 
         // Update phase and emit synthesis:started event
@@ -2062,21 +2794,47 @@ Return the JSON response now:"#,
             research_content.len()
         );
         let synthesis_start = Instant::now();
-        let response = self.send_request(&request).await?;
+        let response = if self.use_batch_api {
+            info!("Submitting synthesis through the Message Batches API");
+            self.send_batch_request(&request, "synthesis", app_handle)
+                .await?
+        } else {
+            // Stream the output so progress can be reported as each card is
+            // written, instead of going quiet for the whole generation.
+            self.send_streaming_request(&request, || {
+                let mut progress = CardProgress::default();
+                move |text: &str| {
+                    if progress.feed(text) {
+                        let message = format!(
+                            "Synthesizing briefing cards... ({} drafted)",
+                            progress.cards
+                        );
+                        research_state::set_phase(&message);
+                        if let Some(app) = app_handle {
+                            let _ = app.emit(
+                                "research:heartbeat",
+                                HeartbeatEvent {
+                                    timestamp: get_timestamp(),
+                                    phase: "synthesizing".to_string(),
+                                    topic_index: None,
+                                    message,
+                                },
+                            );
+                        }
+                    }
+                }
+            })
+            .await?
+        };
         let synthesis_duration = synthesis_start.elapsed().as_millis();
 
-        let content = response
-            .content
-            .iter()
-            .filter_map(|c| c.text.clone())
-            .collect::<Vec<_>>()
-            .join("\n");
+        let content = response.text();
 
-        let tokens = response.usage.input_tokens + response.usage.output_tokens;
+        let tokens = response.usage.total();
 
         info!(
-            "Synthesis API responded in {}ms ({} tokens)",
-            synthesis_duration, tokens
+            "Synthesis API responded in {}ms ({} tokens, {} from cache)",
+            synthesis_duration, tokens, response.usage.cache_read_input_tokens
         );
 
         // Parse the JSON response
@@ -2105,31 +2863,264 @@ Return the JSON response now:"#,
     }
 }
 
+/// Turn a sent Anthropic API request into its response, mapping transport
+/// failures and non-2xx statuses to structured errors.
+async fn check_api_response(
+    response: reqwest::Result<reqwest::Response>,
+) -> Result<reqwest::Response, ResearchError> {
+    let response = response.map_err(|e| {
+        let err = ResearchError::new(
+            ErrorCode::NetworkError,
+            format!("HTTP request failed: {}", e),
+        );
+        error!("Network error: {}", e);
+        err
+    })?;
+
+    if !response.status().is_success() {
+        let status = response.status().as_u16();
+        let retry_after = response
+            .headers()
+            .get(reqwest::header::RETRY_AFTER)
+            .and_then(|v| v.to_str().ok())
+            .and_then(|v| v.trim().parse::<u64>().ok());
+        let body = response.text().await.unwrap_or_default();
+        let err = parse_api_error(status, &body).with_retry_after(retry_after);
+
+        // Log the error
+        error!(
+            "API error {}: {} (code: {:?})",
+            status, err.message, err.code
+        );
+        if err.requires_user_action {
+            error!("USER ACTION REQUIRED: {}", err.user_message);
+        }
+
+        return Err(err);
+    }
+
+    Ok(response)
+}
+
+/// Wait before retry number `attempt` (1-based). A server `retry-after` wins
+/// (capped at a minute); otherwise a random delay in
+/// [0, min(API_RETRY_CAP, API_RETRY_BASE * 2^attempt)] ("full jitter") keeps
+/// concurrent topics from retrying in lockstep.
+fn retry_delay(attempt: u32, retry_after_secs: Option<u64>) -> Duration {
+    if let Some(secs) = retry_after_secs {
+        return Duration::from_secs(secs.min(60));
+    }
+
+    let ceiling = API_RETRY_BASE
+        .saturating_mul(1 << attempt.min(16))
+        .min(API_RETRY_CAP);
+    // RandomState is randomly seeded per instance: a dependency-free jitter source
+    let random = RandomState::new().build_hasher().finish();
+    ceiling.mul_f64(random as f64 / u64::MAX as f64)
+}
+
+/// Parse a message batch status response.
+async fn parse_batch_response(
+    response: reqwest::Result<reqwest::Response>,
+) -> Result<MessageBatch, ResearchError> {
+    check_api_response(response)
+        .await?
+        .json()
+        .await
+        .map_err(|e| {
+            ResearchError::new(
+                ErrorCode::ParseError,
+                format!("Failed to parse message batch: {}", e),
+            )
+        })
+}
+
+/// Pick the result for `custom_id` out of a message batch's JSONL results.
+fn find_batch_result(results: &str, custom_id: &str) -> Result<AnthropicResponse, ResearchError> {
+    for line in results.lines().filter(|l| !l.trim().is_empty()) {
+        let entry: BatchResultLine = serde_json::from_str(line).map_err(|e| {
+            ResearchError::new(
+                ErrorCode::ParseError,
+                format!("Failed to parse batch result: {}", e),
+            )
+        })?;
+        if entry.custom_id != custom_id {
+            continue;
+        }
+        return match entry.result {
+            BatchResult::Succeeded { message } => Ok(message),
+            BatchResult::Errored { error } => Err(parse_api_error(500, &error.to_string())),
+            BatchResult::Canceled => Err(ResearchError::new(
+                ErrorCode::InternalError,
+                "Message batch request was canceled",
+            )),
+            BatchResult::Expired => Err(ResearchError::new(
+                ErrorCode::Timeout,
+                "Message batch request expired before it was processed",
+            )),
+        };
+    }
+
+    Err(ResearchError::new(
+        ErrorCode::InvalidResponse,
+        format!("No result for '{}' in message batch results", custom_id),
+    ))
+}
+
+/// Look up fresh cached research. Cache failures (e.g. the database has not
+/// been initialized yet) are treated as a miss. SQLite calls block, so they
+/// run on the blocking pool rather than stalling the other topics' futures.
+async fn read_topic_cache(cache_key: &str) -> Option<String> {
+    let cache_key = cache_key.to_string();
+    tokio::task::spawn_blocking(move || {
+        crate::db::get_connection()
+            .map_err(|e| e.to_string())
+            .and_then(|conn| {
+                crate::db::get_cached_topic_research(&conn, &cache_key, TOPIC_CACHE_TTL_SECS)
+            })
+    })
+    .await
+    .map_err(|e| format!("cache task failed: {}", e))
+    .and_then(|r| r)
+    .unwrap_or_else(|e| {
+        debug!("Topic research cache unavailable: {}", e);
+        None
+    })
+}
+
+/// Cache a topic's research for later runs (on the blocking pool, like
+/// `read_topic_cache`); failures only cost a future miss.
+async fn write_topic_cache(cache_key: &str, content: &str) {
+    let (cache_key, content) = (cache_key.to_string(), content.to_string());
+    let stored = tokio::task::spawn_blocking(move || {
+        crate::db::get_connection()
+            .map_err(|e| e.to_string())
+            .and_then(|conn| {
+                crate::db::store_topic_research(&conn, &cache_key, &content, TOPIC_CACHE_TTL_SECS)
+            })
+    })
+    .await
+    .map_err(|e| format!("cache task failed: {}", e))
+    .and_then(|r| r);
+    if let Err(e) = stored {
+        warn!("Failed to cache topic research: {}", e);
+    }
+}
+
+/// The "Topic:" part of the research prompt. A group of topics is listed by
+/// number, with instructions to delimit each topic's summary so the response
+/// can be split back up by `split_topic_sections`.
+fn topic_prompt_section(topics: &[String]) -> String {
+    if let [topic] = topics {
+        return format!("Topic: {}", topic);
+    }
+
+    let mut section = String::from("Topics:\n");
+    for (i, topic) in topics.iter().enumerate() {
+        let _ = writeln!(section, "Topic {}: {}", i + 1, topic);
+    }
+    let _ = write!(
+        section,
+        "\nResearch each topic separately and provide the summary below for each one. \
+         Start each topic's summary with a line containing only <<<TOPIC k>>>, where k \
+         is the topic's number above."
+    );
+    section
+}
+
+/// Split a grouped research response into per-topic sections on its
+/// `<<<TOPIC k>>>` delimiters. Topics the response skipped are `None`; a
+/// response with no delimiters at all is attributed to the first topic.
+fn split_topic_sections(response: &str, topic_count: usize) -> Vec<Option<String>> {
+    let mut sections: Vec<Option<String>> = vec![None; topic_count];
+    let markers: Vec<_> = TOPIC_DELIMITER_RE.captures_iter(response).collect();
+
+    if markers.is_empty() {
+        warn!("Grouped research response had no topic delimiters");
+        if let Some(first) = sections.first_mut() {
+            *first = Some(response.trim().to_string());
+        }
+        return sections;
+    }
+
+    for (i, caps) in markers.iter().enumerate() {
+        let whole = caps.get(0).unwrap();
+        let end = markers
+            .get(i + 1)
+            .map_or(response.len(), |next| next.get(0).unwrap().start());
+        let Some(k) = caps[1]
+            .parse::<usize>()
+            .ok()
+            .filter(|k| (1..=topic_count).contains(k))
+        else {
+            continue;
+        };
+        let text = response[whole.end()..end].trim();
+        if !text.is_empty() {
+            sections[k - 1] = Some(text.to_string());
+        }
+    }
+
+    sections
+}
+
+/// Locate the top-level JSON object in a Claude response with a single forward scan.
+///
+/// Skips a leading markdown code fence if one opens before the object, then tracks
+/// brace depth (ignoring braces inside string literals) until the object closes.
+/// If the object never closes (truncated output), the rest of the response is
+/// returned so the caller can attempt a repair.
+fn extract_json(response: &str) -> Option<&str> {
+    let mut scan_from = 0;
+    if let Some(fence) = response.find("```") {
+        if response[..fence].find('{').is_none() {
+            scan_from = fence + 3;
+        }
+    }
+
+    let start = scan_from + response[scan_from..].find('{')?;
+    let mut depth = 0usize;
+    let mut in_string = false;
+    let mut escape = false;
+
+    for (i, b) in response.as_bytes()[start..].iter().enumerate() {
+        if in_string {
+            if escape {
+                escape = false;
+            } else if *b == b'\\' {
+                escape = true;
+            } else if *b == b'"' {
+                in_string = false;
+            }
+            continue;
+        }
+        match b {
+            b'"' => in_string = true,
+            b'{' => depth += 1,
+            b'}' => {
+                depth -= 1;
+                if depth == 0 {
+                    return Some(&response[start..=start + i]);
+                }
+            }
+            _ => {}
+        }
+    }
+
+    Some(response[start..].trim_end())
+}
+
 /// Parse Claude's response into BriefingCard objects.
 fn parse_briefing_response(response: &str) -> Result<Vec<BriefingCard>, String> {
-    // Try to extract JSON from response (Claude might wrap it in markdown)
-    // Use (?s) flag for DOTALL mode to match across newlines
-    let json_str = if let Some(captures) = Regex::new(r"(?s)```(?:json)?\s*(\{.*\})\s*```")
-        .ok()
-        .and_then(|re| re.captures(response))
-    {
-        captures.get(1).map(|m| m.as_str()).unwrap_or(response)
-    } else if let Some(captures) = Regex::new(r"(?s)(\{.*\})")
-        .ok()
-        .and_then(|re| re.captures(response))
-    {
-        captures.get(1).map(|m| m.as_str()).unwrap_or(response)
-    } else {
-        response
-    };
+    // Extract JSON from response (Claude might wrap it in markdown)
+    let json_str = extract_json(response).unwrap_or(response);
 
     // Parse JSON - if it fails, try to provide helpful error message
     match serde_json::from_str::<BriefingResponse>(json_str) {
         Ok(briefing_response) => Ok(briefing_response.cards),
         Err(e) => {
             // Check if response looks truncated (EOF errors)
-            let error_msg = e.to_string();
-            if error_msg.contains("EOF") {
+            if e.is_eof() {
                 // Try to fix truncated JSON by closing the array and object
                 let fixed_attempt = format!("{}\n]\n}}", json_str.trim_end_matches(','));
                 if let Ok(briefing_response) =
@@ -2145,14 +3136,14 @@ fn parse_briefing_response(response: &str) -> Result<Vec<BriefingCard>, String>
                 Err(format!(
                     "Response was truncated (likely hit max_tokens limit). Increase max_tokens in synthesis call. \
                     Error: {}. Response length: {} chars. Last 200 chars: ...{}",
-                    error_msg,
+                    e,
                     json_str.len(),
                     &json_str[json_str.len().saturating_sub(200)..]
                 ))
             } else {
                 Err(format!(
                     "Failed to parse briefing JSON: {}. Response length: {} chars. First 500 chars: {}...",
-                    error_msg,
+                    e,
                     json_str.len(),
                     &json_str[..json_str.len().min(500)]
                 ))
@@ -2165,6 +3156,178 @@ fn parse_briefing_response(response: &str) -> Result<Vec<BriefingCard>, String>
 mod tests {
     use super::*;
 
+    #[test]
+    fn test_cached_system_prompt_serialization_and_usage_total() {
+        let system = serde_json::to_value(cached_system_prompt("Static".to_string())).unwrap();
+        assert_eq!(
+            system,
+            json!([{"type": "text", "text": "Static", "cache_control": {"type": "ephemeral"}}])
+        );
+
+        let usage: Usage =
+            serde_json::from_str(r#"{"input_tokens": 10, "output_tokens": 5}"#).unwrap();
+        assert_eq!(usage.total(), 15);
+        let usage: Usage = serde_json::from_str(
+            r#"{"input_tokens": 10, "output_tokens": 5, "cache_creation_input_tokens": 100, "cache_read_input_tokens": 1000}"#,
+        )
+        .unwrap();
+        assert_eq!(usage.total(), 1115);
+    }
+
+    #[test]
+    fn test_extract_json_ignores_braces_in_strings() {
+        let response = r#"Sure! {"cards": [{"title": "a } b", "summary": "say \"{\"", "x": {}}]} trailing {junk}"#;
+        assert_eq!(
+            extract_json(response),
+            Some(r#"{"cards": [{"title": "a } b", "summary": "say \"{\"", "x": {}}]}"#)
+        );
+    }
+
+    #[test]
+    fn test_extract_json_skips_fence_and_handles_truncation() {
+        let response = "Here it is:\n```json\n{\"cards\": [{\"title\": \"T\"},\n";
+        assert_eq!(
+            extract_json(response),
+            Some("{\"cards\": [{\"title\": \"T\"},")
+        );
+        assert_eq!(extract_json("no json here"), None);
+    }
+
+    #[test]
+    fn test_split_topic_sections() {
+        let response = "Intro\n<<<TOPIC 2>>>\nSecond summary\n<<<TOPIC 1>>>\nFirst summary\n<<<TOPIC 9>>>\nStray";
+        assert_eq!(
+            split_topic_sections(response, 3),
+            vec![
+                Some("First summary".to_string()),
+                Some("Second summary".to_string()),
+                None
+            ]
+        );
+
+        // Without delimiters the whole response goes to the first topic
+        assert_eq!(
+            split_topic_sections(" Just text ", 2),
+            vec![Some("Just text".to_string()), None]
+        );
+    }
+
+    #[test]
+    fn test_research_prompts_are_dated_once_per_run() {
+        use chrono::TimeZone;
+
+        let agent =
+            ResearchAgent::new("key".to_string(), None, false, "standard".to_string(), true);
+        let now = chrono::Local.with_ymd_and_hms(2026, 3, 9, 8, 0, 0).unwrap();
+        let prompts = agent.research_prompts(&agent.run_tools(), now);
+
+        let prompt = prompts.user_prompt(&["Rust".to_string()]);
+        assert!(prompt.starts_with("Research the following topic"));
+        assert!(prompt.contains("preferably March 2026)\n\nTopic: Rust\n\nCRITICAL:"));
+        let system = &prompts.system[0].text;
+        assert!(system.contains("Today's date is March 09, 2026"));
+    }
+
+    #[test]
+    fn test_response_text_joins_text_blocks() {
+        let response: AnthropicResponse = serde_json::from_str(
+            r#"{"content": [
+                {"type": "text", "text": "first"},
+                {"type": "tool_use", "id": "t1", "name": "fetch_webpage", "input": {}},
+                {"type": "text", "text": "second"}
+            ], "usage": {"input_tokens": 1, "output_tokens": 1}, "stop_reason": "end_turn"}"#,
+        )
+        .unwrap();
+        assert_eq!(response.text(), "first\nsecond");
+    }
+
+    #[test]
+    fn test_sse_decoder_buffers_partial_events() {
+        let mut decoder = SseDecoder::default();
+        assert!(decoder
+            .push(b"event: ping\ndata: {\"type\": \"ping\"}\n\nevent: content_block_delta\ndata: {\"a\"")
+            .eq(&["{\"type\": \"ping\"}".to_string()]));
+        assert_eq!(decoder.push(b": 1}\n\n"), vec!["{\"a\": 1}".to_string()]);
+        assert!(decoder.push(b"").is_empty());
+    }
+
+    #[test]
+    fn test_stream_events_parse() {
+        let event: StreamEvent = serde_json::from_str(
+            r#"{"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "Hi"}}"#,
+        )
+        .unwrap();
+        assert!(matches!(
+            event,
+            StreamEvent::ContentBlockDelta {
+                index: 0,
+                delta: StreamDelta::TextDelta { ref text },
+            } if text == "Hi"
+        ));
+
+        for other in [
+            r#"{"type": "ping"}"#,
+            r#"{"type": "content_block_stop", "index": 0}"#,
+        ] {
+            let event: StreamEvent = serde_json::from_str(other).unwrap();
+            assert!(matches!(event, StreamEvent::Other));
+        }
+    }
+
+    #[test]
+    fn test_stream_error_event_is_classified() {
+        // The whole event is handed to parse_api_error, like an error response
+        let data =
+            r#"{"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}"#;
+        assert!(matches!(
+            serde_json::from_str::<StreamEvent>(data).unwrap(),
+            StreamEvent::Error { .. }
+        ));
+        let err = parse_api_error(500, data);
+        assert_eq!(err.code, ErrorCode::ApiOverloaded);
+        assert!(err.code.is_transient());
+    }
+
+    #[test]
+    fn test_card_progress_counts_closed_cards() {
+        let mut progress = CardProgress::default();
+        assert!(!progress.feed(r#"{"cards": [{"title": "a } {", "x": "\"}"#));
+        assert!(progress.feed(r#""}, {"title": "b"#));
+        assert_eq!(progress.cards, 1);
+        assert!(progress.feed(r#""}]}"#));
+        assert_eq!(progress.cards, 2);
+    }
+
+    #[test]
+    fn test_retry_delay() {
+        assert_eq!(retry_delay(1, Some(7)), Duration::from_secs(7));
+        assert_eq!(retry_delay(1, Some(600)), Duration::from_secs(60));
+        for attempt in 1..=8 {
+            let delay = retry_delay(attempt, None);
+            assert!(delay <= API_RETRY_CAP);
+            assert!(delay <= API_RETRY_BASE * 2u32.pow(attempt));
+        }
+    }
+
+    #[test]
+    fn test_find_batch_result() {
+        let results = concat!(
+            r#"{"custom_id": "other", "result": {"type": "expired"}}"#,
+            "\n",
+            r#"{"custom_id": "synthesis", "result": {"type": "succeeded", "message": {"content": [{"type": "text", "text": "ok"}], "usage": {"input_tokens": 3, "output_tokens": 1}, "stop_reason": "end_turn"}}}"#,
+            "\n"
+        );
+        let response = find_batch_result(results, "synthesis").unwrap();
+        assert_eq!(response.content[0].text.as_deref(), Some("ok"));
+        assert_eq!(response.usage.total(), 4);
+
+        let errored = r#"{"custom_id": "synthesis", "result": {"type": "errored", "error": {"type": "error", "error": {"type": "overloaded_error", "message": "Overloaded"}}}}"#;
+        let err = find_batch_result(errored, "synthesis").unwrap_err();
+        assert!(matches!(err.code, ErrorCode::ApiOverloaded));
+
+        assert!(find_batch_result(results, "missing").is_err());
+    }
+
     #[test]
     fn test_parse_briefing_response() {
         let response = r#"{"cards": [{"title": "Test", "summary": "Test summary", "detailed_content": "Detailed test content", "sources": [], "suggested_next": null, "relevance": "high", "topic": "Test Topic"}]}"#;
@@ -2225,6 +3388,15 @@ That's the summary!"#;
         assert!(result.is_err());
     }
 
+    #[test]
+    fn test_parse_briefing_response_recovers_truncated_cards() {
+        let response = r#"```json
+{"cards": [{"title": "Kept", "summary": "S", "detailed_content": "D", "sources": [], "suggested_next": null, "relevance": "high", "topic": "T"},"#;
+        let cards = parse_briefing_response(response).unwrap();
+        assert_eq!(cards.len(), 1);
+        assert_eq!(cards[0].title, "Kept");
+    }
+
     #[test]
     fn test_parse_briefing_response_with_markdown_content() {
         // Test that detailed_content with markdown formatting is parsed correctly
@@ -2348,9 +3520,10 @@ That's the summary!"#;
         );
         assert!(agent.enable_web_search);
 
-        // Test that get_tools_json includes web_search when enabled
-        let tools = agent.get_tools_json();
+        // Test that the run's tool definitions include web_search when enabled
+        let tools = agent.run_tools();
         let has_web_search = tools
+            .json
             .iter()
             .any(|t| t.get("type").and_then(|v| v.as_str()) == Some(WEB_SEARCH_TOOL_TYPE));
         assert!(
@@ -2373,6 +3546,59 @@ That's the summary!"#;
         assert!(result.unwrap_err().contains("No topics provided"));
     }
 
+    #[cfg(unix)]
+    #[test]
+    fn test_run_tools_routes_mcp_tools_to_servers() {
+        let mut agent = ResearchAgent::new(
+            "test-api-key".to_string(),
+            None,
+            false,
+            "standard".to_string(),
+            true,
+        );
+        agent.mcp_client = Some(Arc::new(McpClient::with_fake_servers(
+            &["a", "b"],
+            Duration::ZERO,
+        )));
+        let tools = agent.run_tools();
+        assert_eq!(
+            tools.mcp_servers.get("a_tool").map(String::as_str),
+            Some("a")
+        );
+        assert_eq!(
+            tools.mcp_servers.get("b_tool").map(String::as_str),
+            Some("b")
+        );
+    }
+
+    #[tokio::test]
+    async fn test_backoff_sleep_wakes_on_cancel() {
+        let mut agent = ResearchAgent::new(
+            "test-api-key".to_string(),
+            None,
+            false,
+            "standard".to_string(),
+            true,
+        );
+        let token = Arc::new(AtomicBool::new(false));
+        agent.set_cancellation_token(token.clone());
+        assert!(agent
+            .sleep_unless_cancelled(Duration::from_millis(10))
+            .await
+            .is_ok());
+
+        let start = Instant::now();
+        let (slept, _) = tokio::join!(
+            agent.sleep_unless_cancelled(Duration::from_secs(30)),
+            async {
+                tokio::time::sleep(Duration::from_millis(50)).await;
+                token.store(true, Ordering::Relaxed);
+            }
+        );
+        assert!(slept.is_err());
+        assert!(start.elapsed() < Duration::from_secs(2));
+    }
+
     #[test]
     fn test_extract_text_from_html() {
         let html =
@@ -2473,6 +3699,21 @@ That's the summary!"#;
         );
     }
 
+    #[test]
+    fn test_classify_tool() {
+        assert_eq!(
+            classify_tool("Firecrawl:firecrawl_agent"),
+            ToolClass::Expensive
+        );
+        assert_eq!(classify_tool("firecrawl_map"), ToolClass::Firecrawl);
+        assert_eq!(
+            classify_tool("Brave:brave_web_search"),
+            ToolClass::StandardSearch
+        );
+        assert_eq!(classify_tool("fetch_webpage"), ToolClass::StandardSearch);
+        assert_eq!(classify_tool("get_github_activity"), ToolClass::Other);
+    }
+
     #[test]
     fn test_research_mode_stored_correctly() {
         let agent_standard =
@@ -2496,7 +3737,7 @@ That's the summary!"#;
         ];
 
         for (tool_name, should_match) in tool_names {
-            let is_firecrawl_agent = tool_name.contains("firecrawl_agent");
+            let is_firecrawl_agent = classify_tool(tool_name) == ToolClass::Expensive;
             assert_eq!(
                 is_firecrawl_agent, should_match,
                 "Tool '{}' should{} match firecrawl_agent",
@@ -2533,4 +3774,25 @@ That's the summary!"#;
             );
         }
     }
+
+    #[test]
+    fn test_tool_result_cache() {
+        let agent =
+            ResearchAgent::new("key".to_string(), None, false, "standard".to_string(), true);
+        let key = r#"get_github_activity:{"repo":"a/b"}"#;
+        assert!(agent.cached_tool_result(key).is_none());
+
+        agent.cache_tool_result(key.to_string(), "3 commits");
+        assert_eq!(agent.cached_tool_result(key).as_deref(), Some("3 commits"));
+
+        // Stale entries are ignored
+        if let Some(stale) = Instant::now().checked_sub(TOOL_RESULT_CACHE_TTL) {
+            agent
+                .tool_cache
+                .lock()
+                .unwrap()
+                .insert(key.to_string(), (stale, "old".to_string()));
+            assert!(agent.cached_tool_result(key).is_none());
+        }
+    }
 }
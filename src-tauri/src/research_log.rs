@@ -45,6 +45,18 @@ impl ErrorCode {
         matches!(self, ErrorCode::InvalidApiKey | ErrorCode::BudgetExceeded)
     }
 
+    /// Returns true if the failed request may succeed when retried
+    /// (rate limits, overload/5xx, network trouble).
+    pub fn is_transient(&self) -> bool {
+        matches!(
+            self,
+            ErrorCode::RateLimited
+                | ErrorCode::ApiOverloaded
+                | ErrorCode::NetworkError
+                | ErrorCode::Timeout
+        )
+    }
+
     /// Get a user-friendly message for this error code.
     pub fn user_message(&self) -> &'static str {
         match self {
@@ -118,6 +130,9 @@ pub struct ResearchError {
     pub user_message: String,
     pub requires_user_action: bool,
     pub details: Option<String>,
+    /// Server-requested wait before retrying (from a `retry-after` header)
+    #[serde(default, skip_serializing_if = "Option::is_none")]
+    pub retry_after_secs: Option<u64>,
 }
 
 impl ResearchError {
@@ -130,6 +145,7 @@ impl ResearchError {
             user_message,
             requires_user_action,
             details: None,
+            retry_after_secs: None,
         }
     }
 
@@ -137,6 +153,11 @@ impl ResearchError {
         self.details = Some(details.into());
         self
     }
+
+    pub fn with_retry_after(mut self, retry_after_secs: Option<u64>) -> Self {
+        self.retry_after_secs = retry_after_secs;
+        self
+    }
 }
 
 impl std::fmt::Display for ResearchError {
@@ -646,6 +667,15 @@ mod tests {
         assert!(!ErrorCode::ToolExecutionFailed.requires_user_action());
     }
 
+    #[test]
+    fn test_error_code_transient() {
+        assert!(ErrorCode::RateLimited.is_transient());
+        assert!(ErrorCode::ApiOverloaded.is_transient());
+        assert!(ErrorCode::NetworkError.is_transient());
+        assert!(!ErrorCode::InvalidApiKey.is_transient());
+        assert!(!ErrorCode::InvalidResponse.is_transient());
+    }
+
     #[test]
     fn test_parse_api_error_authentication() {
         let body = r#"{"type":"error","error":{"type":"authentication_error","message":"Invalid API key"}}"#;
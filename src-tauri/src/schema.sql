@@ -73,6 +73,13 @@ CREATE TABLE IF NOT EXISTS bookmarks (
     UNIQUE(briefing_id, card_index)
 );
 
+-- Per-topic research results, reused by reruns within the cache TTL
+CREATE TABLE IF NOT EXISTS topic_research_cache (
+    cache_key TEXT PRIMARY KEY,       -- See ResearchAgent::topic_cache_key
+    content TEXT NOT NULL,            -- Research summary returned for the topic(s)
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE INDEX IF NOT EXISTS idx_briefings_date ON briefings(date DESC);
 CREATE INDEX IF NOT EXISTS idx_feedback_briefing ON feedback(briefing_id);
 -- Note: idx_chat_messages_briefing_card index is created in migration after card_index column is added